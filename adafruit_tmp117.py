@@ -32,22 +32,16 @@ Implementation Notes
 * Adafruit's Bus Device library:
   https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 
-* Adafruit's Register library:
-  https://github.com/adafruit/Adafruit_CircuitPython_Register
-
 """
 
 import time
 from collections import namedtuple
 
 from adafruit_bus_device import i2c_device
-from adafruit_register.i2c_bit import ROBit, RWBit
-from adafruit_register.i2c_bits import ROBits, RWBits
-from adafruit_register.i2c_struct import ROUnaryStruct, UnaryStruct
 from micropython import const
 
 try:
-    from typing import Optional, Sequence, Tuple, Union
+    from typing import Callable, Optional, Sequence, Tuple, Union
 
     from busio import I2C
 except ImportError:
@@ -59,19 +53,30 @@ __repo__ = "https:#github.com/adafruit/Adafruit_CircuitPython_TMP117.git"
 
 _I2C_ADDR = 0x48  # default I2C Address
 _TEMP_RESULT = const(0x00)
-_CONFIGURATION = const(0x01)
-_T_HIGH_LIMIT = const(0x02)
-_T_LOW_LIMIT = const(0x03)
-_EEPROM_UL = const(0x04)
-_EEPROM1 = const(0x05)
-_EEPROM2 = const(0x06)
-_TEMP_OFFSET = const(0x07)
-_EEPROM3 = const(0x08)
-_DEVICE_ID = const(0x0F)
+# the registers the adafruit_tmp117_* feature modules also use aren't const(), as
+# CircuitPython only keeps underscore const() names inside the module defining them
+_CONFIGURATION = 0x01
+_T_HIGH_LIMIT = 0x02
+_T_LOW_LIMIT = 0x03
+_EEPROM_UL = 0x04
+_EEPROM1 = 0x05
+_EEPROM2 = 0x06
+_TEMP_OFFSET = 0x07
+_EEPROM3 = 0x08
+_DEVICE_ID = 0x0F
 _DEVICE_ID_VALUE = 0x0117
 _TMP119_ID_VALUE = 0x2117
 _TMP117_RESOLUTION = 0.0078125  # Resolution of the device, found on (page 1 of datasheet)
 
+# CONFIGURATION bits that hold settings; the alert/data-ready flags, EEPROM_Busy and
+# Soft_Reset are status or one-shot bits and are never cached
+_CONFIG_SETTINGS_MASK = const(0x0FFC)
+_SOFT_RESET_BIT = const(0x0002)
+
+_MIN_POLL_INTERVAL = 0.001  # shortest interval between data ready polls
+_MAX_POLL_INTERVAL = 0.008  # longest interval between polls, unless conversions are long
+_DATA_READY_TIMEOUT = 1.0  # extra time allowed past the expected conversion time
+
 _CONTINUOUS_CONVERSION_MODE = 0b00  # Continuous Conversion Mode
 _ONE_SHOT_MODE = 0b11  # One Shot Conversion Mode
 _SHUTDOWN_MODE = 0b01  # Shutdown Conversion Mode
@@ -79,134 +84,349 @@ _SHUTDOWN_MODE = 0b01  # Shutdown Conversion Mode
 AlertStatus = namedtuple("AlertStatus", ["high_alert", "low_alert"])
 
 
-def _convert_to_integer(bytes_to_convert: bytearray) -> int:
-    """Use bitwise operators to convert the bytes into integers."""
-    integer = None
-    for chunk in bytes_to_convert:
-        if not integer:
-            integer = chunk
-        else:
-            integer <<= 8
-            integer |= chunk
-    return integer
-
-
 class CV:
-    """struct helper"""
+    """struct helper. Each subclass has its values as class attributes, and ``string`` and
+    ``lsb`` tuples indexed by value, with `None` for unused values"""
+
+    string = ()
+    lsb = ()
 
     @classmethod
     def add_values(cls, value_tuples: Sequence[Tuple[str, int, Union[int, str], Optional[int]]]):
         """Add CV values to the class"""
-        cls.string = {}
-        cls.lsb = {}
-
-        for value_tuple in value_tuples:
-            name, value, string, lsb = value_tuple
+        size = max(value_tuple[1] for value_tuple in value_tuples) + 1
+        string = [None] * size
+        lsb = [None] * size
+        for name, value, value_string, value_lsb in value_tuples:
             setattr(cls, name, value)
-            cls.string[value] = string
-            cls.lsb[value] = lsb
+            string[value] = value_string
+            lsb[value] = value_lsb
+        cls.string = tuple(string)
+        cls.lsb = tuple(lsb)
 
     @classmethod
     def is_valid(cls, value: int) -> bool:
         """Validate that a given value is a member"""
-        return value in cls.string
+        return (
+            isinstance(value, int)
+            and 0 <= value < len(cls.string)
+            and cls.string[value] is not None
+        )
 
 
 class AverageCount(CV):
     """Options for `averaged_measurements`"""
 
-
-AverageCount.add_values(
-    (
-        ("AVERAGE_1X", 0b00, 1, None),
-        ("AVERAGE_8X", 0b01, 8, None),
-        ("AVERAGE_32X", 0b10, 32, None),
-        ("AVERAGE_64X", 0b11, 64, None),
-    )
-)
+    AVERAGE_1X = const(0b00)
+    AVERAGE_8X = const(0b01)
+    AVERAGE_32X = const(0b10)
+    AVERAGE_64X = const(0b11)
+    string = (1, 8, 32, 64)
+    lsb = (None, None, None, None)
 
 
 class MeasurementDelay(CV):
     """Options for `measurement_delay`"""
 
+    DELAY_0_0015_S = const(0b000)
+    DELAY_0_125_S = const(0b001)
+    DELAY_0_250_S = const(0b010)
+    DELAY_0_500_S = const(0b011)
+    DELAY_1_S = const(0b100)
+    DELAY_4_S = const(0b101)
+    DELAY_8_S = const(0b110)
+    DELAY_16_S = const(0b111)
+    string = (0.00155, 0.125, 0.250, 0.500, 1, 4, 8, 16)
+    lsb = (None, None, None, None, None, None, None, None)
 
-MeasurementDelay.add_values(
-    (
-        ("DELAY_0_0015_S", 0b000, 0.00155, None),
-        ("DELAY_0_125_S", 0b01, 0.125, None),
-        ("DELAY_0_250_S", 0b010, 0.250, None),
-        ("DELAY_0_500_S", 0b011, 0.500, None),
-        ("DELAY_1_S", 0b100, 1, None),
-        ("DELAY_4_S", 0b101, 4, None),
-        ("DELAY_8_S", 0b110, 8, None),
-        ("DELAY_16_S", 0b111, 16, None),
-    )
-)
+
+CONVERSION_TIME = 0.0155
+"""The time one conversion takes in seconds. A measurement takes this times its
+`AverageCount` count"""
+
+MIN_CYCLE_TIME = (0.0155, 0.125, 0.5, 1.0)
+"""The shortest time between measurements in continuous mode for each `AverageCount`, in
+seconds, from the datasheet's conversion cycle time table. The cycle is the longer of this and
+the `MeasurementDelay`"""
 
 
 class AlertMode(CV):
     """Options for `alert_mode`. See `alert_mode` for more information."""
 
-
-AlertMode.add_values((("WINDOW", 0, "Window", None), ("HYSTERESIS", 1, "Hysteresis", None)))
+    WINDOW = const(0)
+    HYSTERESIS = const(1)
+    string = ("Window", "Hysteresis")
+    lsb = (None, None)
 
 
 class MeasurementMode(CV):
     """Options for `measurement_mode`. See `measurement_mode` for more information."""
 
+    CONTINUOUS = const(0)
+    SHUTDOWN = const(1)
+    ONE_SHOT = const(3)
+    string = ("Continuous", "Shutdown", None, "One shot")
+    lsb = (None, None, None, None)
 
-MeasurementMode.add_values(
-    (
-        ("CONTINUOUS", 0, "Continuous", None),
-        ("ONE_SHOT", 3, "One shot", None),
-        ("SHUTDOWN", 1, "Shutdown", None),
-    )
-)
 
+def _settings(config: int) -> int:
+    # the settings bits of a CONFIGURATION value as they stand once any one shot has finished.
+    # The sensor drops from ONE_SHOT to SHUTDOWN by itself, so a cached ONE_SHOT would go stale
+    # and writing it back along with another setting would start an unwanted conversion
+    config &= _CONFIG_SETTINGS_MASK
+    if (config >> 10) & 0b11 == _ONE_SHOT_MODE:
+        config ^= (_ONE_SHOT_MODE ^ _SHUTDOWN_MODE) << 10
+    return config
 
-class TMP117:
-    """Library for the TI TMP117 high-accuracy temperature sensor"""
 
-    _part_id = ROUnaryStruct(_DEVICE_ID, ">H")
-    _raw_temperature = ROUnaryStruct(_TEMP_RESULT, ">h")
-    _raw_high_limit = UnaryStruct(_T_HIGH_LIMIT, ">h")
-    _raw_low_limit = UnaryStruct(_T_LOW_LIMIT, ">h")
-    _raw_temperature_offset = UnaryStruct(_TEMP_OFFSET, ">h")
+class _Register:
+    """A signed 16-bit register, read and written through the sensor's shared buffer"""
+
+    __slots__ = ("address",)
+
+    def __init__(self, address: int):
+        self.address = address
+
+    def __get__(self, obj: Optional["TMP117"], objtype: Optional[type] = None) -> int:
+        if obj is None:
+            return self
+        value = obj._read_register(self.address)
+        return value - 0x10000 if value & 0x8000 else value
+
+    def __set__(self, obj: "TMP117", value: int) -> None:
+        obj._write_register(self.address, max(-0x8000, min(0x7FFF, value)) & 0xFFFF)
+        obj._profile_registers = None
+
+
+class _ConfigBits:
+    """A field of the cached CONFIGURATION register. Reads come from the host-side copy and
+    writes update the copy and write the whole register in a single transaction."""
+
+    __slots__ = ("bit_mask", "lowest_bit")
+
+    def __init__(self, num_bits: int, lowest_bit: int):
+        self.bit_mask = ((1 << num_bits) - 1) << lowest_bit
+        self.lowest_bit = lowest_bit
+
+    def __get__(self, obj: Optional["TMP117"], objtype: Optional[type] = None) -> int:
+        if obj is None:
+            return self
+        return (obj._config & self.bit_mask) >> self.lowest_bit
+
+    def __set__(self, obj: "TMP117", value: int) -> None:
+        obj._write_config(self.insert(obj._config, value))
+
+    def insert(self, config: int, value: int) -> int:
+        """Return ``config`` with this field replaced by ``value``"""
+        return (config & ~self.bit_mask) | ((int(value) << self.lowest_bit) & self.bit_mask)
+
+
+class _ConfigBit(_ConfigBits):
+    """A single boolean bit of the cached CONFIGURATION register"""
+
+    __slots__ = ()
+
+    def __init__(self, bit: int):
+        super().__init__(1, bit)
+
+    def __get__(self, obj: Optional["TMP117"], objtype: Optional[type] = None) -> bool:
+        if obj is None:
+            return self
+        return bool(obj._config & self.bit_mask)
+
+
+class _HeldDevice:
+    """Stands in for the I2C device of a `TMP117` while :py:meth:`TMP117.locked` holds the bus,
+    so that each register access uses the held lock instead of taking its own"""
+
+    __slots__ = ("device", "readinto", "write", "write_then_readinto")
+
+    def __init__(self, device: i2c_device.I2CDevice):
+        self.device = device
+        self.readinto = device.readinto
+        self.write = device.write
+        self.write_then_readinto = device.write_then_readinto
+
+    def __getattr__(self, name: str):
+        return getattr(self.device, name)
+
+    def __enter__(self) -> "_HeldDevice":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
 
-    # these three bits will clear on read in some configurations, so we read them together
-    _alert_status_data_ready = ROBits(3, _CONFIGURATION, 13, 2, False)
-    _eeprom_busy = ROBit(_CONFIGURATION, 12, 2, False)
-    _mode = RWBits(2, _CONFIGURATION, 10, 2, False)
 
-    _raw_measurement_delay = RWBits(3, _CONFIGURATION, 7, 2, False)
-    _raw_averaged_measurements = RWBits(2, _CONFIGURATION, 5, 2, False)
+class _BusLock:
+    """Context manager returned by :py:meth:`TMP117.locked`"""
 
-    _raw_alert_mode = RWBit(_CONFIGURATION, 4, 2, False)  # T/nA bits in the datasheet
-    _int_active_high = RWBit(_CONFIGURATION, 3, 2, False)
-    _data_ready_int_en = RWBit(_CONFIGURATION, 2, 2, False)
-    _soft_reset = RWBit(_CONFIGURATION, 1, 2, False)
+    __slots__ = ("_sensor", "_device")
 
-    def __init__(self, i2c_bus: I2C, address: int = _I2C_ADDR):
+    def __init__(self, sensor: "TMP117"):
+        self._sensor = sensor
+        self._device = None
+
+    def __enter__(self) -> "TMP117":
+        device = self._sensor.i2c_device
+        device.__enter__()
+        self._device = device
+        self._sensor.i2c_device = _HeldDevice(device)
+        return self._sensor
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self._sensor.i2c_device = self._device
+        return self._device.__exit__(exc_type, exc_value, traceback)
+
+
+class TMP117:
+    """Library for the TI TMP117 high-accuracy temperature sensor
+
+    :param ~busio.I2C i2c_bus: The I2C bus the TMP117 is connected to.
+    :param int address: The I2C address of the sensor. Defaults to :const:`0x48`
+    :param bool reset: Reset and `initialize` the sensor. Set to `False` to keep the
+        configuration the sensor already has, such as settings stored in its EEPROM, and
+        skip waiting for the first measurement. Defaults to `True`
+
+    The settings stored in the CONFIGURATION register are cached on the host. Reading the
+    register clears the alert and data ready flags, so the cache is only refreshed when the
+    register has to be read anyway (for example by `alert_status`) or when
+    :py:meth:`sync_configuration` is called.
+
+    Features beyond configuring and reading the sensor, such as :py:meth:`samples`, the
+    `identity`, the EEPROM and register snapshots, are implemented in ``adafruit_tmp117_*``
+    modules that their methods import the first time they are used, so that programs which
+    don't use them don't load them."""
+
+    _raw_high_limit = _Register(_T_HIGH_LIMIT)
+    _raw_low_limit = _Register(_T_LOW_LIMIT)
+    _raw_temperature_offset = _Register(_TEMP_OFFSET)
+
+    # fields of the cached CONFIGURATION register
+    _mode = _ConfigBits(2, 10)
+
+    _raw_measurement_delay = _ConfigBits(3, 7)
+    _raw_averaged_measurements = _ConfigBits(2, 5)
+
+    _raw_alert_mode = _ConfigBits(1, 4)  # T/nA bits in the datasheet
+    _int_active_high = _ConfigBit(3)
+    _data_ready_int_en = _ConfigBit(2)
+
+    # state most sensors never change, kept on the class until it does
+    _data_ready_polls = 0
+    _data_ready_wait = None
+    _identity = None
+    _eeprom_contents = None
+    # the limit and offset registers as last snapshotted or restored, if still known
+    _profile_registers = None
+    _profiles = None
+
+    def __init__(self, i2c_bus: I2C, address: int = _I2C_ADDR, reset: bool = True):
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
-        if self._part_id not in {_DEVICE_ID_VALUE, _TMP119_ID_VALUE}:
+        # reused for every register transfer done by the driver itself
+        self._buffer = bytearray(3)
+        self._config = 0
+        if self._read_register(_DEVICE_ID) not in {_DEVICE_ID_VALUE, _TMP119_ID_VALUE}:
             raise AttributeError("Cannot find a TMP117 or TMP119")
-        # currently set when `alert_status` is read, but not exposed
+        if not reset:
+            self.sync_configuration()
+            return
         self.reset()
         self.initialize()
 
     def reset(self):
         """Reset the sensor to its unconfigured power-on state"""
-        self._soft_reset = True
+        if self._profile_registers is not None:
+            self._profile_registers = None
+        self._write_config(self._config | _SOFT_RESET_BIT)
+        # Datasheet specifies that reset will finish in 2ms, after which the power-on
+        # configuration has been reloaded from EEPROM
+        time.sleep(0.002)
+        self.sync_configuration()
+
+    def locked(self) -> _BusLock:
+        """A context manager that holds the I2C bus lock for a sequence of operations, so that
+        other devices on the same bus can't be accessed part way through it and the individual
+        operations don't each lock and unlock the bus.
+
+        Anything done inside the block that waits, such as :py:meth:`take_single_measurement`,
+        keeps the bus locked while it waits.
+
+        **Warning:** only use this sensor inside the block. Accessing any other device on the
+        same bus there, including another `TMP117` or one in an
+        `adafruit_tmp117_group.TMP117Group` or `adafruit_tmp117_scheduler.OneShotScheduler`,
+        waits for the lock this block holds and never returns.
+
+        .. code-block::python
+
+            with tmp117.locked():
+                high_limit = tmp117.high_limit
+                low_limit = tmp117.low_limit
+                offset = tmp117.temperature_offset
+                status = tmp117.alert_status
+
+        """
+        return _BusLock(self)
+
+    def sync_configuration(self):
+        """Re-read the CONFIGURATION register into the cached settings. Settings are normally
+        read from the cache, so this is only needed if the sensor was reconfigured by something
+        other than this driver.
+
+        **Note:** reading the register clears the alert and data ready flags"""
+        self._read_config()
+
+    def configure(
+        self,
+        mode: Optional[int] = None,
+        averaging: Optional[int] = None,
+        delay: Optional[int] = None,
+        alert_mode: Optional[int] = None,
+    ):
+        """Apply several settings with a single write to the CONFIGURATION register. Settings
+        left as `None` keep their current value.
+
+        :param int mode: a `MeasurementMode`. Unlike setting `measurement_mode`, this does not
+            wait for a measurement to complete
+        :param int averaging: an `AverageCount`, see `averaged_measurements`
+        :param int delay: a `MeasurementDelay`, see `measurement_delay`
+        :param int alert_mode: an `AlertMode`, see `alert_mode`
+
+        .. code-block::python
+
+            tmp117.configure(
+                mode=MeasurementMode.CONTINUOUS,
+                averaging=AverageCount.AVERAGE_1X,
+                delay=MeasurementDelay.DELAY_0_125_S,
+            )
+
+        """
+        config = self._config
+        if mode is not None:
+            if not MeasurementMode.is_valid(mode):
+                raise AttributeError("mode must be a `MeasurementMode`")
+            config = TMP117._mode.insert(config, mode)
+        if averaging is not None:
+            if not AverageCount.is_valid(averaging):
+                raise AttributeError("averaging must be an `AverageCount`")
+            config = TMP117._raw_averaged_measurements.insert(config, averaging)
+        if delay is not None:
+            if not MeasurementDelay.is_valid(delay):
+                raise AttributeError("delay must be a `MeasurementDelay`")
+            config = TMP117._raw_measurement_delay.insert(config, delay)
+        if alert_mode is not None:
+            if not AlertMode.is_valid(alert_mode):
+                raise AttributeError("alert_mode must be an `AlertMode`")
+            config = TMP117._raw_alert_mode.insert(config, alert_mode)
+        # writing ONE_SHOT starts a conversion, so it is never skipped
+        if _settings(config) != self._config or mode == _ONE_SHOT_MODE:
+            self._write_config(config)
 
     def initialize(self):
         """Configure the sensor with sensible defaults. `initialize` is primarily provided to be
         called after `reset`, however it can also be used to easily set the sensor to a known
         configuration"""
-        # Datasheet specifies that reset will finish in 2ms however by default the first
-        # conversion will be averaged 8x and take 1s
-        # TODO: sleep depending on current averaging config
-        self._set_mode_and_wait_for_measurement(_CONTINUOUS_CONVERSION_MODE)  # one shot
-        time.sleep(1)
+        # waits for the first conversion using the current averaging, 8x (124ms) by default
+        self._set_mode_and_wait_for_measurement(_CONTINUOUS_CONVERSION_MODE)
 
     @property
     def temperature(self):
@@ -214,6 +434,20 @@ class TMP117:
 
         return self._read_temperature()
 
+    @property
+    def raw_temperature(self) -> int:
+        """The current measured temperature as the signed 16-bit value of the temperature
+        register, in steps of 7.8125 millidegrees Celsius. Unlike `temperature`, reading this
+        does not allocate any memory, which makes it suitable for tight sampling loops"""
+        return self._raw_temperature
+
+    @property
+    def temperature_millicelsius(self) -> int:
+        """The current measured temperature as an integer number of millidegrees Celsius,
+        rounded to the nearest millidegree. Like `raw_temperature`, reading this does not
+        allocate any memory"""
+        return (self._raw_temperature * 125 + 8) >> 4
+
     @property
     def temperature_offset(self):
         """User defined temperature offset to be added to measurements from `temperature`
@@ -465,6 +699,150 @@ class TMP117:
 
         return self._set_mode_and_wait_for_measurement(_ONE_SHOT_MODE)  # one shot
 
+    def read_status_into(self, buffer: bytearray) -> None:
+        """Read the alert and data ready flags into the first three items of ``buffer``
+        without allocating any memory. ``buffer[0]`` is set to 1 if the high alert is
+        triggered, ``buffer[1]`` to 1 if the low alert is triggered and ``buffer[2]`` to 1 if
+        a new measurement is ready, and each is set to 0 otherwise.
+
+        **Note:** like `alert_status`, this clears the flags on the sensor
+
+        .. code-block::python
+
+            status = bytearray(3)
+            while True:
+                tmp117.read_status_into(status)
+                if status[2]:
+                    print(tmp117.temperature_millicelsius)
+
+        """
+        flags = self._read_config()
+        buffer[0] = (flags >> 15) & 1
+        buffer[1] = (flags >> 14) & 1
+        buffer[2] = (flags >> 13) & 1
+
+    def read(self):
+        """Read the temperature together with the alert and data ready flags, as a `Reading
+        <adafruit_tmp117_readings.Reading>`. See `adafruit_tmp117_readings.read`
+
+        **Note:** like `alert_status`, this clears the flags on the sensor"""
+        from adafruit_tmp117_readings import read  # noqa: PLC0415
+
+        return read(self)
+
+    def readinto(self, buffer: bytearray) -> None:
+        """Read the temperature and CONFIGURATION registers into the first four bytes of
+        ``buffer`` without allocating any memory. ``buffer[0:2]`` is set to the raw temperature
+        and ``buffer[2:4]`` to the register holding the alert and data ready flags, both big
+        endian as sent by the sensor.
+
+        The sensor doesn't advance its register pointer on reads, so the registers are read
+        one after the other while the bus stays locked. The flags are read first, so a set
+        data ready flag always belongs to the temperature read with it or an older one.
+
+        **Note:** like `alert_status`, this clears the flags on the sensor
+
+        .. code-block::python
+
+            registers = bytearray(4)
+            while True:
+                tmp117.readinto(registers)
+                if registers[2] & 0x20:  # data ready
+                    raw = registers[0] << 8 | registers[1]
+                    print(raw)
+
+        """
+        with self.i2c_device as i2c:
+            buffer[2] = _CONFIGURATION
+            i2c.write_then_readinto(buffer, buffer, out_start=2, out_end=3, in_start=2, in_end=4)
+            buffer[0] = _TEMP_RESULT
+            i2c.write_then_readinto(buffer, buffer, out_end=1, in_end=2)
+        self._config = _settings(buffer[2] << 8 | buffer[3])
+
+    def enable_data_ready_interrupt(
+        self, wait: Callable[[float], bool], active_high: bool = False
+    ) -> None:
+        """Signal new measurements on the ALERT pin instead of the alert flags, and wait for the
+        pin rather than polling the sensor over I2C. :py:meth:`take_single_measurement`,
+        `measurement_mode` and :py:meth:`samples` then read the sensor only once the
+        measurement is ready.
+
+        While enabled the ALERT pin no longer reflects `alert_status`, although the alert flags
+        can still be read with `alert_status`. A :py:meth:`reset`, or anything else that turns
+        the setting off on the sensor, sends the driver back to polling until this is called
+        again.
+
+        :param wait: A callable that takes a timeout in seconds and returns `True` once the
+            ALERT pin becomes active, or `False` if the timeout passes first
+        :param bool active_high: Drive the ALERT pin high rather than low when a measurement
+            is ready
+
+        .. code-block::python
+
+            import time
+            import board
+            import digitalio
+            from adafruit_tmp117 import TMP117
+
+            i2c = board.I2C()  # uses board.SCL and board.SDA
+            tmp117 = TMP117(i2c)
+
+            alert = digitalio.DigitalInOut(board.D5)
+            alert.pull = digitalio.Pull.UP  # the ALERT pin is open drain
+
+            def wait_for_alert(timeout):
+                deadline = time.monotonic() + timeout
+                while alert.value:
+                    if time.monotonic() > deadline:
+                        return False
+                return True
+
+            tmp117.enable_data_ready_interrupt(wait_for_alert)
+            for sample in tmp117.samples():
+                print(sample.temperature)
+
+        """
+        config = TMP117._data_ready_int_en.insert(self._config, True)
+        self._write_config(TMP117._int_active_high.insert(config, active_high))
+        self._data_ready_wait = wait
+
+    def disable_data_ready_interrupt(self) -> None:
+        """Return the ALERT pin to signaling `alert_status` and go back to polling the sensor
+        for new measurements"""
+        self._data_ready_int_en = False
+        self._data_ready_wait = None
+
+    def samples(self):
+        """Put the sensor into continuous mode if it isn't already and yield each new
+        measurement exactly once as a `Sample <adafruit_tmp117_readings.Sample>`. See
+        `adafruit_tmp117_readings.samples`
+
+        .. code-block::python
+
+            for sample in tmp117.samples():
+                print(sample.sequence, sample.timestamp, sample.temperature)
+
+        """
+        from adafruit_tmp117_readings import samples  # noqa: PLC0415
+
+        return samples(self)
+
+    def watch(self, deadband: float, wait: Optional[Callable[[float], bool]] = None):
+        """Yield a `TemperatureChange <adafruit_tmp117_readings.TemperatureChange>` each time the
+        temperature moves more than ``deadband`` degrees Celsius away from the last reported
+        value, using the sensor's limits to detect the change. See
+        `adafruit_tmp117_readings.watch`
+
+        .. code-block::python
+
+            for change in tmp117.watch(0.5):
+                print("Temperature changed from", change.previous, "to", change.temperature)
+
+        """
+        from adafruit_tmp117_readings import watch  # noqa: PLC0415
+
+        return watch(self, deadband, wait)
+
     @property
     def alert_mode(self):
         """Sets the behavior of the `low_limit`, `high_limit`, and `alert_status` properties.
@@ -490,42 +868,178 @@ class TMP117:
     @property
     def serial_number(self):
         """A 48-bit, factory-set unique identifier for the device."""
-        eeprom1_data = bytearray(2)
-        eeprom2_data = bytearray(2)
-        eeprom3_data = bytearray(2)
-        # Fetch EEPROM registers
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(bytearray([_EEPROM1]), eeprom1_data)
-            i2c.write_then_readinto(bytearray([_EEPROM2]), eeprom2_data)
-            i2c.write_then_readinto(bytearray([_EEPROM3]), eeprom3_data)
-        # Combine the 2-byte portions
-        combined_id = bytearray(
-            [
-                eeprom1_data[0],
-                eeprom1_data[1],
-                eeprom2_data[0],
-                eeprom2_data[1],
-                eeprom3_data[0],
-                eeprom3_data[1],
-            ]
+        return self.identity.serial_number
+
+    @property
+    def identity(self):
+        """The identity of the sensor as a `DeviceIdentity
+        <adafruit_tmp117_identity.DeviceIdentity>`, read the first time it is needed and then
+        cached. See `adafruit_tmp117_identity.identity`"""
+        if self._identity is None:
+            from adafruit_tmp117_identity import identity  # noqa: PLC0415
+
+            return identity(self)
+        return self._identity
+
+    def refresh_identity(self):
+        """Read the identity of the sensor again, updating the cached `identity`"""
+        from adafruit_tmp117_identity import refresh_identity  # noqa: PLC0415
+
+        return refresh_identity(self)
+
+    def save_to_eeprom(self) -> int:
+        """Store the current configuration, `high_limit`, `low_limit` and `temperature_offset` in
+        the sensor's EEPROM so that they are restored at power on, verifying them afterwards.
+        See `adafruit_tmp117_eeprom.save_to_eeprom`
+
+        :return: the number of registers written
+        """
+        from adafruit_tmp117_eeprom import save_to_eeprom  # noqa: PLC0415
+
+        return save_to_eeprom(self)
+
+    @property
+    def profiles(self) -> dict:
+        """Named `RegisterSnapshot <adafruit_tmp117_profiles.RegisterSnapshot>` objects that
+        :py:meth:`restore` can switch to by name"""
+        if self._profiles is None:
+            self._profiles = {}
+        return self._profiles
+
+    def snapshot(self):
+        """Read every register from CONFIGURATION (0x01) to EEPROM3 (0x08) in one lock of the
+        bus, as a `RegisterSnapshot <adafruit_tmp117_profiles.RegisterSnapshot>` that can be
+        kept in `profiles`. See `adafruit_tmp117_profiles.snapshot`
+
+        **Note:** reading the CONFIGURATION register clears the alert and data ready flags"""
+        from adafruit_tmp117_profiles import snapshot  # noqa: PLC0415
+
+        return snapshot(self)
+
+    def restore(self, profile) -> int:
+        """Restore the configuration, `high_limit`, `low_limit` and `temperature_offset` from a
+        :py:meth:`snapshot`, or from the snapshot with that name in `profiles`, writing only the
+        registers that changed. See `adafruit_tmp117_profiles.restore`
+
+        :return: the number of registers written
+        """
+        from adafruit_tmp117_profiles import restore  # noqa: PLC0415
+
+        return restore(self, profile)
+
+    def load_from_eeprom(self):
+        """Restore the configuration, `high_limit`, `low_limit` and `temperature_offset` stored
+        in the sensor's EEPROM, as at power on, and wait for the first measurement with them.
+        See `adafruit_tmp117_eeprom.load_from_eeprom`"""
+        from adafruit_tmp117_eeprom import load_from_eeprom  # noqa: PLC0415
+
+        load_from_eeprom(self)
+
+    @property
+    def conversion_time(self) -> float:
+        """The time in seconds the sensor needs to complete one measurement with the current
+        `averaged_measurements` setting. Each averaged conversion takes 15.5ms"""
+        return AverageCount.string[self._raw_averaged_measurements] * CONVERSION_TIME
+
+    @property
+    def data_ready_polls(self) -> int:
+        """The number of status reads needed before the most recent measurement taken with
+        :py:meth:`take_single_measurement` or by setting `measurement_mode` was ready"""
+        return self._data_ready_polls
+
+    @property
+    def _cycle_time(self) -> float:
+        # time between measurements in continuous mode; averaging can stretch it past the delay
+        return max(
+            MeasurementDelay.string[self._raw_measurement_delay],
+            MIN_CYCLE_TIME[self._raw_averaged_measurements],
         )
-        # Convert to an integer
-        return _convert_to_integer(combined_id)
 
     def _set_mode_and_wait_for_measurement(self, mode: int) -> float:
+        self._start_conversion(mode)
+        if mode == _SHUTDOWN_MODE:
+            return self._read_temperature()
+        self._wait_for_data_ready(self.conversion_time)
+
+        return self._read_temperature()
+
+    def _start_conversion(self, mode: int) -> None:
         self._mode = mode
-        # poll for data ready
+        if mode != _SHUTDOWN_MODE:
+            # the new conversion can't have finished yet, so this only clears a stale flag
+            # left over from an earlier conversion
+            self._read_status()
+
+    @property
+    def _pin_wait(self) -> Optional[Callable[[float], bool]]:
+        # the ALERT pin wait, while the pin still signals data ready. A reset, a reload from
+        # EEPROM or an outside change to the configuration can clear DR/Alert without
+        # disable_data_ready_interrupt being called
+        return self._data_ready_wait if self._data_ready_int_en else None
+
+    def _wait_for_data_ready(self, expected: float, spread: float = 0.0) -> None:
+        wait = self._pin_wait
+        if wait is None:
+            for delay in self._data_ready_delays(expected, spread=spread):
+                time.sleep(delay)
+            return
+        if not wait(expected + spread + _DATA_READY_TIMEOUT):
+            raise RuntimeError("Timed out waiting for a measurement")
+        self._data_ready_polls = 0
+
+    def _data_ready_delays(
+        self, expected: float, timeout: float = _DATA_READY_TIMEOUT, spread: float = 0.0
+    ):
+        # yields the delays to sleep for until a conversion expected to finish in `expected`
+        # seconds is ready: most of the expected time first, then a short backoff between
+        # status reads, giving up `timeout` seconds after the conversion was due. `spread` is
+        # how much later than `expected` the conversion may finish when its exact time isn't
+        # known, such as the next conversion of a sensor that is already running
+        deadline = time.monotonic() + expected + spread + timeout
+        yield expected * 0.95
+        # poll in steps of a small part of the conversion, backing off if it runs long
+        interval = max(_MIN_POLL_INTERVAL, (expected + spread) / 40)
+        max_interval = max(_MAX_POLL_INTERVAL, interval * 4)
+        polls = 1
         while not self._read_status()[2]:
-            time.sleep(0.001)
+            if time.monotonic() > deadline:
+                raise RuntimeError("Timed out waiting for a measurement")
+            yield interval
+            interval = min(interval * 2, max_interval)
+            polls += 1
+        self._data_ready_polls = polls
+
+    def _read_register(self, register: int) -> int:
+        buffer = self._buffer
+        buffer[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buffer, buffer, out_end=1, in_start=1)
+        return buffer[1] << 8 | buffer[2]
+
+    def _write_register(self, register: int, value: int) -> None:
+        buffer = self._buffer
+        buffer[0] = register
+        buffer[1] = (value >> 8) & 0xFF
+        buffer[2] = value & 0xFF
+        with self.i2c_device as i2c:
+            i2c.write(buffer)
 
-        return self._read_temperature()
+    def _read_config(self) -> int:
+        # the alert and data ready flags clear on read in some configurations, so every read of
+        # the register also refreshes the cached settings. A read during a one shot still
+        # returns ONE_SHOT, and when waiting on the ALERT pin it is the last read of the
+        # conversion, so it is cached as the SHUTDOWN the sensor is about to be in
+        config = self._read_register(_CONFIGURATION)
+        self._config = _settings(config)
+        return config
 
-    # eeprom write enable to set defaults for limits and config
-    # requires context manager or something to perform a general call reset
+    def _write_config(self, config: int) -> None:
+        self._write_register(_CONFIGURATION, config)
+        self._config = _settings(config)
 
     def _read_status(self) -> Tuple[int, int, int]:
         # 3 bits: high_alert, low_alert, data_ready
-        status_flags = self._alert_status_data_ready
+        status_flags = self._read_config() >> 13
 
         high_alert = 0b100 & status_flags > 0
         low_alert = 0b010 & status_flags > 0
@@ -533,5 +1047,10 @@ class TMP117:
 
         return (high_alert, low_alert, data_ready)
 
+    @property
+    def _raw_temperature(self) -> int:
+        raw = self._read_register(_TEMP_RESULT)
+        return raw - 0x10000 if raw & 0x8000 else raw
+
     def _read_temperature(self) -> float:
         return self._raw_temperature * _TMP117_RESOLUTION
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_asyncio`
+================================================================================
+
+asyncio support for the TI TMP117 Temperature sensor. Waiting for a measurement yields to the
+event loop instead of blocking, so a single loop can service many sensors at once.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+* Adafruit's asyncio library:
+  https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+
+"""
+
+import asyncio
+import time
+
+from adafruit_tmp117 import TMP117, MeasurementMode
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+
+class TMP117Async(TMP117):
+    """A `TMP117 <adafruit_tmp117.TMP117>` whose measurement methods are coroutines.
+
+    The constructor and the `measurement_mode` setter still block while they wait for a
+    measurement; use :py:meth:`readings` to start continuous measurements without blocking.
+
+    .. code-block::python
+
+        import asyncio
+        import board
+        from adafruit_tmp117_asyncio import TMP117Async
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+
+        async def log(address):
+            tmp117 = TMP117Async(i2c, address)
+            async for temperature in tmp117.readings():
+                print(hex(address), temperature)
+
+        async def main():
+            await asyncio.gather(log(0x48), log(0x49))
+
+        asyncio.run(main())
+
+    """
+
+    async def take_single_measurement(self) -> float:
+        """Perform a single measurement cycle respecting the value of `averaged_measurements`,
+        returning the measurement once complete. Other tasks run while the sensor measures."""
+        self._start_conversion(MeasurementMode.ONE_SHOT)
+        for delay in self._data_ready_delays(self.conversion_time):
+            await asyncio.sleep(delay)
+        return self._read_temperature()
+
+    async def wait_data_ready(self, timeout: Optional[float] = None) -> None:
+        """Wait until the sensor reports that a new measurement is ready. This clears the data
+        ready flag, so the new measurement should be read with `temperature`.
+
+        :param float timeout: Seconds to wait before raising `RuntimeError`. Defaults to one
+            measurement cycle plus a second
+        """
+        if timeout is None:
+            timeout = self._cycle_time + 1
+        for delay in self._data_ready_delays(0, timeout):
+            await asyncio.sleep(delay)
+
+    def readings(self) -> "_Readings":
+        """Put the sensor into continuous mode if it isn't already and return an asynchronous
+        iterator of new measurements. Each measurement is read once, as soon as it is ready,
+        and the event loop is free while the sensor measures."""
+        return _Readings(self)
+
+
+class _Readings:
+    """Asynchronous iterator returned by :py:meth:`TMP117Async.readings`"""
+
+    def __init__(self, sensor: TMP117Async):
+        self._sensor = sensor
+        now = time.monotonic()
+        if sensor.measurement_mode != MeasurementMode.CONTINUOUS:
+            sensor._start_conversion(MeasurementMode.CONTINUOUS)
+            now += sensor.conversion_time
+            self._spread = 0.0
+        else:
+            # already converting, so the next conversion could finish any time within a cycle
+            self._spread = sensor._cycle_time
+        self._next = now
+
+    def __aiter__(self) -> "_Readings":
+        return self
+
+    async def __anext__(self) -> float:
+        sensor = self._sensor
+        expected = max(0, self._next - time.monotonic())
+        for delay in sensor._data_ready_delays(expected, spread=self._spread):
+            await asyncio.sleep(delay)
+        self._spread = 0.0
+        self._next = time.monotonic() + sensor._cycle_time
+        return sensor._read_temperature()
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_batch`
+================================================================================
+
+Bulk conversion of raw TI TMP117 Temperature sensor register values, for processing logged
+readings on a host computer. When NumPy is installed every function works on whole arrays at
+once and returns NumPy arrays; without it the same functions work on sequences and return lists.
+
+**Software and Dependencies:**
+
+* NumPy (optional): https://numpy.org
+
+"""
+
+from adafruit_tmp117 import _TMP117_RESOLUTION  # noqa: PLC2701
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from typing import Sequence, Tuple, Union
+except ImportError:
+    pass
+
+# the range accepted by the `high_limit`, `low_limit` and `temperature_offset` setters
+_MIN_CELSIUS = -256
+_MAX_CELSIUS = 256
+
+
+def _signed(value: int) -> int:
+    value &= 0xFFFF
+    return value - 0x10000 if value & 0x8000 else value
+
+
+def _raw_array(raw):
+    # register words may be given as signed values or as the unsigned 16-bit words read from
+    # the bus, so both are reinterpreted as int16
+    raw = np.asarray(raw)
+    if raw.dtype == np.int16:
+        return raw
+    return (raw.astype(np.int64) & 0xFFFF).astype(np.uint16).view(np.int16)
+
+
+def raw_from_bytes(data: bytes) -> Union["np.ndarray", list]:
+    """Unpack raw readings from big endian 16-bit register data, as read from the sensor.
+    With NumPy the result is a view of ``data`` that is not copied."""
+    if np is not None:
+        return np.frombuffer(data, dtype=">i2")
+    return [_signed(data[i] << 8 | data[i + 1]) for i in range(0, len(data) - 1, 2)]
+
+
+def raw_to_celsius(raw: Sequence[int]) -> Union["np.ndarray", list]:
+    """Convert raw temperature, limit or offset register values to degrees Celsius"""
+    if np is not None:
+        return _raw_array(raw) * _TMP117_RESOLUTION
+    return [_signed(value) * _TMP117_RESOLUTION for value in raw]
+
+
+def celsius_to_raw(celsius: Sequence[float]) -> Union["np.ndarray", list]:
+    """Convert degrees Celsius to raw register values the same way the `high_limit`,
+    `low_limit` and `temperature_offset` setters of `adafruit_tmp117.TMP117` do, truncating
+    towards zero.
+
+    :raises ValueError: if any value is outside -256 to 256
+    """
+    if np is not None:
+        celsius = np.asarray(celsius, dtype=np.float64)
+        if celsius.size and (celsius.min() < _MIN_CELSIUS or celsius.max() > _MAX_CELSIUS):
+            raise ValueError("values must be from -256 to 256")
+        return np.clip(np.trunc(celsius / _TMP117_RESOLUTION), -0x8000, 0x7FFF).astype(np.int16)
+    raw = []
+    for value in celsius:
+        if value < _MIN_CELSIUS or value > _MAX_CELSIUS:
+            raise ValueError("values must be from -256 to 256")
+        raw.append(max(-0x8000, min(0x7FFF, int(value / _TMP117_RESOLUTION))))
+    return raw
+
+
+def decode_status(
+    config: Sequence[int],
+) -> Tuple[Union["np.ndarray", list], Union["np.ndarray", list], Union["np.ndarray", list]]:
+    """Decode the high alert, low alert and data ready flags from configuration register
+    values, as `adafruit_tmp117.TMP117.alert_status` does for a single value.
+
+    :return: three sequences of booleans: ``(high_alert, low_alert, data_ready)``
+    """
+    if np is not None:
+        config = np.asarray(config).astype(np.uint16)
+        return (
+            (config & 0x8000) != 0,
+            (config & 0x4000) != 0,
+            (config & 0x2000) != 0,
+        )
+    return (
+        [bool(value & 0x8000) for value in config],
+        [bool(value & 0x4000) for value in config],
+        [bool(value & 0x2000) for value in config],
+    )
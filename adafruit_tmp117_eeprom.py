@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_eeprom`
+================================================================================
+
+Storing the settings of a TI TMP117 Temperature sensor in its EEPROM, so that they are restored
+at power on, with as few EEPROM writes as possible. This implements
+:py:meth:`TMP117.save_to_eeprom <adafruit_tmp117.TMP117.save_to_eeprom>` and
+:py:meth:`TMP117.load_from_eeprom <adafruit_tmp117.TMP117.load_from_eeprom>`.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+import time
+
+from micropython import const
+
+from adafruit_tmp117 import (
+    _CONFIGURATION,  # noqa: PLC2701
+    _EEPROM_UL,  # noqa: PLC2701
+    _SHUTDOWN_MODE,  # noqa: PLC2701
+    _T_HIGH_LIMIT,  # noqa: PLC2701
+    _T_LOW_LIMIT,  # noqa: PLC2701
+    _TEMP_OFFSET,  # noqa: PLC2701
+)
+
+try:
+    from typing import Tuple
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+_EEPROM_UNLOCK = const(0x8000)  # EUN bit of the EEPROM unlock register
+_EEPROM_BUSY = const(0x1000)  # EEPROM_Busy bit of the CONFIGURATION register
+_EEPROM_TIMEOUT = 0.05  # programming one EEPROM word takes about 7ms
+# the registers restored from EEPROM at power on that `save_to_eeprom` programs
+_PERSISTENT_REGISTERS = (_CONFIGURATION, _T_HIGH_LIMIT, _T_LOW_LIMIT, _TEMP_OFFSET)
+
+
+def save_to_eeprom(sensor: TMP117) -> int:
+    """Store the current configuration, `high_limit <adafruit_tmp117.TMP117.high_limit>`,
+    `low_limit <adafruit_tmp117.TMP117.low_limit>` and `temperature_offset
+    <adafruit_tmp117.TMP117.temperature_offset>` of ``sensor`` in its EEPROM so that they are
+    restored at power on. A sensor that has been set up this way can be used with
+    ``TMP117(i2c, reset=False)``, which doesn't write to the sensor at all.
+
+    Only values that differ from those already in the EEPROM are programmed, to save EEPROM
+    wear. If they aren't known from an earlier save or load through the same `TMP117
+    <adafruit_tmp117.TMP117>`, the sensor is reset to reload them for comparison and the
+    current values are then written back. Once programmed, the values are verified by reloading
+    them from the EEPROM, raising `RuntimeError` if they don't match.
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to store the settings of
+    :return: the number of registers written
+    """
+    values = _persistent_values(sensor)
+    saved = sensor._eeprom_contents
+    if saved is None:
+        # a reset reloads the registers from the EEPROM, so read them back to compare
+        sensor.reset()
+        saved = sensor._eeprom_contents = _persistent_values(sensor)
+        _write_values(sensor, values, saved)
+    changed = [
+        (register, value)
+        for register, value, old_value in zip(_PERSISTENT_REGISTERS, values, saved)
+        if value != old_value
+    ]
+    if not changed:
+        return 0
+
+    sensor._write_register(_EEPROM_UL, _EEPROM_UNLOCK)
+    try:
+        for register, value in changed:
+            sensor._write_register(register, value)
+            _wait_for_eeprom(sensor)
+    finally:
+        sensor._write_register(_EEPROM_UL, 0)
+
+    load_from_eeprom(sensor)
+    if sensor._eeprom_contents != values:
+        raise RuntimeError("EEPROM contents do not match the values written")
+    return len(changed)
+
+
+def load_from_eeprom(sensor: TMP117) -> None:
+    """Restore the configuration, `high_limit <adafruit_tmp117.TMP117.high_limit>`, `low_limit
+    <adafruit_tmp117.TMP117.low_limit>` and `temperature_offset
+    <adafruit_tmp117.TMP117.temperature_offset>` stored in the EEPROM of ``sensor``, as at power
+    on, and wait for the first measurement with them.
+
+    **Note:** if the restored `measurement_mode <adafruit_tmp117.TMP117.measurement_mode>` is
+    :py:const:`MeasurementMode.SHUTDOWN <adafruit_tmp117.MeasurementMode.SHUTDOWN>` no
+    measurement is taken, and `temperature <adafruit_tmp117.TMP117.temperature>` reads -256
+    until one is requested
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to restore
+    """
+    sensor.reset()
+    sensor._eeprom_contents = _persistent_values(sensor)
+    if sensor._mode != _SHUTDOWN_MODE:
+        # the temperature register holds its reset value until the first conversion. The
+        # restored configuration may not signal data ready on the ALERT pin, so poll
+        for delay in sensor._data_ready_delays(sensor.conversion_time):
+            time.sleep(delay)
+
+
+def _persistent_values(sensor: TMP117) -> Tuple[int, ...]:
+    # the cache never holds ONE_SHOT, so a one shot is stored as the shutdown it ends in
+    return (sensor._config,) + tuple(
+        sensor._read_register(register) for register in _PERSISTENT_REGISTERS[1:]
+    )
+
+
+def _write_values(sensor: TMP117, values: Tuple[int, ...], current: Tuple[int, ...]) -> None:
+    # write the persistent registers that differ, the configuration last so that any
+    # conversions it starts have their limits in place
+    for register, value, old_value in zip(_PERSISTENT_REGISTERS[1:], values[1:], current[1:]):
+        if value != old_value:
+            sensor._write_register(register, value)
+    if values[0] != current[0]:
+        sensor._write_config(values[0])
+
+
+def _wait_for_eeprom(sensor: TMP117) -> None:
+    deadline = time.monotonic() + _EEPROM_TIMEOUT
+    time.sleep(0.007)
+    while sensor._read_config() & _EEPROM_BUSY:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Timed out waiting for the EEPROM")
+        time.sleep(0.001)
@@ -0,0 +1,444 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_emulator`
+================================================================================
+
+A register-level emulation of the TI TMP117 and TMP119 Temperature sensors and an I2C bus to
+attach them to, for running the `adafruit_tmp117` driver without hardware. The emulated bus can
+be passed anywhere a `busio.I2C` is expected, so the driver code runs unchanged on top of
+`adafruit_bus_device.i2c_device.I2CDevice`.
+
+Conversions follow the datasheet's conversion cycle timing for the configured averaging and
+delay. Time comes from a clock object, which can be a `VirtualClock` so that tests and
+benchmarks run instantly and deterministically.
+
+.. code-block::python
+
+    import adafruit_tmp117
+    from adafruit_tmp117_emulator import EmulatedI2C, TMP117Emulator, VirtualClock
+
+    clock = VirtualClock()
+    sensor = TMP117Emulator(clock=clock, temperature=21.5)
+    i2c = EmulatedI2C(sensor)
+
+    with clock.patch(adafruit_tmp117):
+        tmp117 = adafruit_tmp117.TMP117(i2c)
+        print(tmp117.take_single_measurement(), "after", clock.now, "virtual seconds")
+
+"""
+
+import time
+
+try:
+    from typing import Optional
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+_RESOLUTION = 0.0078125  # degrees Celsius per LSB
+_CONVERSION_TIME = 0.0155  # seconds per averaged conversion
+_RESET_TIME = 0.002
+_EEPROM_WRITE_TIME = 0.007
+# the datasheet's conversion cycle time table, kept apart from the driver's copy so that a
+# mistake in either shows up as a timing mismatch: the conversions averaged and the shortest
+# cycle for each averaging setting, and the standby delays
+_AVERAGING = (1, 8, 32, 64)
+_MIN_CYCLE_TIME = (0.0155, 0.125, 0.5, 1.0)
+_CYCLE_TIME = (0.0155, 0.125, 0.25, 0.5, 1.0, 4.0, 8.0, 16.0)
+
+_TEMP_RESULT = 0x00
+_CONFIGURATION = 0x01
+_T_HIGH_LIMIT = 0x02
+_T_LOW_LIMIT = 0x03
+_EEPROM_UL = 0x04
+_EEPROM1 = 0x05
+_EEPROM2 = 0x06
+_TEMP_OFFSET = 0x07
+_EEPROM3 = 0x08
+_DEVICE_ID = 0x0F
+
+# registers with an EEPROM copy that is loaded at power on and reset
+_PROGRAMMABLE = (
+    _CONFIGURATION,
+    _T_HIGH_LIMIT,
+    _T_LOW_LIMIT,
+    _EEPROM1,
+    _EEPROM2,
+    _TEMP_OFFSET,
+    _EEPROM3,
+)
+
+_HIGH_ALERT = 0x8000
+_LOW_ALERT = 0x4000
+_DATA_READY = 0x2000
+_EEPROM_BUSY = 0x1000
+_SETTINGS_MASK = 0x0FFC
+_SOFT_RESET = 0x0002
+_EEPROM_UNLOCK = 0x8000
+
+_CONTINUOUS = 0b00
+_SHUTDOWN = 0b01
+_ONE_SHOT = 0b11
+
+
+def _signed(value: int) -> int:
+    return value - 0x10000 if value & 0x8000 else value
+
+
+class VirtualClock:
+    """A clock that only moves when it is told to sleep. It has the `monotonic` and `sleep`
+    functions of the `time` module, so it can stand in for it.
+
+    :param float start: The initial time in seconds
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        """The current virtual time in seconds"""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance the virtual time by ``seconds``"""
+        self.now += max(0, seconds)
+
+    def patch(self, *modules) -> "_ClockPatch":
+        """A context manager that replaces the ``time`` module used by each of ``modules`` with
+        this clock, restoring it on exit. Include every module that waits: `adafruit_tmp117`,
+        and `adafruit_tmp117_readings` or `adafruit_tmp117_eeprom` for the methods they back"""
+        return _ClockPatch(self, modules)
+
+
+class _ClockPatch:
+    def __init__(self, clock: VirtualClock, modules: tuple):
+        self._clock = clock
+        self._modules = modules
+        self._originals = []
+
+    def __enter__(self) -> VirtualClock:
+        self._originals = [module.time for module in self._modules]
+        for module in self._modules:
+            module.time = self._clock
+        return self._clock
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        for module, original in zip(self._modules, self._originals):
+            module.time = original
+        return False
+
+
+class TMP117Emulator:
+    """An emulated TMP117 or TMP119 that behaves as the real part does at the register level:
+
+    * the temperature, configuration, limit, EEPROM, offset and device ID registers
+    * conversions timed by `averaged_measurements` and `measurement_delay` in continuous mode,
+      and one shot conversions that put the device into shutdown when finished
+    * the data ready flag, cleared when the configuration or temperature register is read
+    * the alert flags, which clear when the configuration register is read in alert (window)
+      mode and follow the temperature in therm (hysteresis) mode
+    * EEPROM programming with the unlock register and the EEPROM busy flag
+    * soft reset, which reloads the EEPROM
+    * the ALERT pin, as `alert_pin`
+
+    Pointer auto-increment is not emulated: reading past the two bytes of a register returns
+    the same register again.
+
+    :param int address: The I2C address. Defaults to :const:`0x48`
+    :param float temperature: The temperature in degrees Celsius that conversions measure. It
+        can be changed at any time with the `temperature` attribute
+    :param bool tmp119: Emulate a TMP119 rather than a TMP117
+    :param int serial_number: The 48-bit serial number stored in the EEPROM
+    :param clock: An object with a ``monotonic()`` method such as `VirtualClock`. Defaults to the
+        `time` module
+
+    The ``conversions`` and ``eeprom_writes`` attributes count the conversions completed and the
+    EEPROM words programmed.
+    """
+
+    def __init__(
+        self,
+        address: int = 0x48,
+        temperature: float = 25.0,
+        tmp119: bool = False,
+        serial_number: int = 0x117117117117,
+        clock=time,
+    ):
+        self.address = address
+        self.temperature = temperature
+        self.clock = clock
+        self.part_id = 0x2117 if tmp119 else 0x0117
+        self.conversions = 0
+        self.eeprom_writes = 0
+        self.eeprom = {
+            _CONFIGURATION: 0x0220,
+            _T_HIGH_LIMIT: 0x6000,
+            _T_LOW_LIMIT: 0x8000,
+            _EEPROM1: (serial_number >> 32) & 0xFFFF,
+            _EEPROM2: (serial_number >> 16) & 0xFFFF,
+            _TEMP_OFFSET: 0,
+            _EEPROM3: serial_number & 0xFFFF,
+        }
+        self.registers = {}
+        self.pointer = 0
+        self._flags = 0
+        self._unlocked = False
+        self._eeprom_busy_until = 0.0
+        self._next_conversion = None
+        self._power_on()
+
+    @property
+    def config(self) -> int:
+        """The settings bits of the configuration register"""
+        return self.registers[_CONFIGURATION]
+
+    @property
+    def mode(self) -> int:
+        """The conversion mode bits of the configuration register"""
+        self._update()
+        return (self.config >> 10) & 0b11
+
+    @property
+    def conversion_time(self) -> float:
+        """The time one conversion takes with the current averaging"""
+        return _AVERAGING[(self.config >> 5) & 0b11] * _CONVERSION_TIME
+
+    @property
+    def cycle_time(self) -> float:
+        """The time between conversions in continuous mode"""
+        return max(
+            _CYCLE_TIME[(self.config >> 7) & 0b111], _MIN_CYCLE_TIME[(self.config >> 5) & 0b11]
+        )
+
+    @property
+    def alert_pin(self) -> bool:
+        """The logic level of the ALERT pin, with its pull-up"""
+        return self._alert_active() == bool(self.config & 0x0008)  # POL
+
+    def wait_for_alert(self, timeout: float) -> bool:
+        """Wait for the ALERT pin to become active by sleeping on the emulator's clock until
+        each conversion finishes. This has the signature expected by
+        :py:meth:`adafruit_tmp117.TMP117.enable_data_ready_interrupt` so it can stand in for a
+        real pin.
+
+        :return: `True` if the pin became active before ``timeout`` seconds passed
+        """
+        deadline = self.clock.monotonic() + timeout
+        while not self._alert_active():
+            now = self.clock.monotonic()
+            if now >= deadline or self._next_conversion is None:
+                return False
+            self.clock.sleep(min(self._next_conversion, deadline) - now)
+        return True
+
+    def read_register(self, register: int) -> int:
+        """Read a register as the I2C interface would, including clearing flags on read"""
+        self._update()
+        if register == _CONFIGURATION:
+            value = self.config | self._flags
+            if self.clock.monotonic() < self._eeprom_busy_until:
+                value |= _EEPROM_BUSY
+            self._flags &= ~_DATA_READY
+            if not self.config & 0x0010:  # alert mode flags clear on read
+                self._flags &= ~(_HIGH_ALERT | _LOW_ALERT)
+            return value
+        if register == _TEMP_RESULT:
+            self._flags &= ~_DATA_READY
+        if register == _EEPROM_UL:
+            value = _EEPROM_UNLOCK if self._unlocked else 0
+            if self.clock.monotonic() < self._eeprom_busy_until:
+                value |= 0x4000
+            return value
+        if register == _DEVICE_ID:
+            return self.part_id
+        return self.registers.get(register, 0)
+
+    def write_register(self, register: int, value: int) -> None:
+        """Write a register as the I2C interface would"""
+        self._update()
+        if register == _EEPROM_UL:
+            self._unlocked = bool(value & _EEPROM_UNLOCK)
+            return
+        if register == _CONFIGURATION and value & _SOFT_RESET:
+            self._power_on(self.clock.monotonic() + _RESET_TIME)
+            return
+        if register not in _PROGRAMMABLE:
+            return
+        if self._unlocked:
+            if self.clock.monotonic() < self._eeprom_busy_until:
+                return  # writes are ignored while the EEPROM is busy
+            self.eeprom[register] = value & (
+                _SETTINGS_MASK if register == _CONFIGURATION else 0xFFFF
+            )
+            self._eeprom_busy_until = self.clock.monotonic() + _EEPROM_WRITE_TIME
+            self.eeprom_writes += 1
+        if register == _CONFIGURATION:
+            self._write_config(value)
+        else:
+            self.registers[register] = value & 0xFFFF
+
+    def _alert_active(self) -> bool:
+        self._update()
+        if self.config & 0x0004:  # DR/Alert
+            return bool(self._flags & _DATA_READY)
+        return bool(self._flags & (_HIGH_ALERT | _LOW_ALERT))
+
+    def _power_on(self, start: Optional[float] = None) -> None:
+        self.registers = dict(self.eeprom)
+        self.registers[_TEMP_RESULT] = 0x8000
+        self._flags = 0
+        self._unlocked = False
+        self._start_conversions(self.clock.monotonic() if start is None else start)
+
+    def _write_config(self, value: int) -> None:
+        self.registers[_CONFIGURATION] = value & _SETTINGS_MASK
+        self._start_conversions(self.clock.monotonic())
+
+    def _start_conversions(self, now: float) -> None:
+        if (self.config >> 10) & 0b11 == _SHUTDOWN:
+            self._next_conversion = None
+        else:
+            self._next_conversion = now + self.conversion_time
+
+    def _update(self) -> None:
+        # complete any conversions that have finished since the last access
+        now = self.clock.monotonic()
+        if self._next_conversion is None or now < self._next_conversion:
+            return
+        mode = (self.config >> 10) & 0b11
+        if mode == _ONE_SHOT:
+            completed = 1
+            self.registers[_CONFIGURATION] = (self.config & ~0x0C00) | (_SHUTDOWN << 10)
+            self._next_conversion = None
+        else:
+            cycle_time = self.cycle_time
+            completed = int((now - self._next_conversion) // cycle_time) + 1
+            self._next_conversion += completed * cycle_time
+        self.conversions += completed
+        self._convert()
+
+    def _convert(self) -> None:
+        offset = _signed(self.registers[_TEMP_OFFSET]) * _RESOLUTION
+        raw = round((self.temperature + offset) / _RESOLUTION)
+        raw = max(-0x8000, min(0x7FFF, raw))
+        self.registers[_TEMP_RESULT] = raw & 0xFFFF
+        self._flags |= _DATA_READY
+
+        high_limit = _signed(self.registers[_T_HIGH_LIMIT])
+        low_limit = _signed(self.registers[_T_LOW_LIMIT])
+        if self.config & 0x0010:  # therm mode: hysteresis between the limits
+            if raw > high_limit:
+                self._flags |= _HIGH_ALERT
+            elif raw < low_limit:
+                self._flags &= ~_HIGH_ALERT
+        else:  # alert mode: flags latch until read
+            if raw > high_limit:
+                self._flags |= _HIGH_ALERT
+            if raw < low_limit:
+                self._flags |= _LOW_ALERT
+
+
+class EmulatedI2C:
+    """An I2C bus with emulated devices attached. It has the methods of `busio.I2C` that
+    `adafruit_bus_device.i2c_device.I2CDevice` uses.
+
+    :param devices: The `TMP117Emulator` objects on the bus
+
+    The bus counts its traffic in the ``transactions``, ``bytes_transferred`` and ``locks``
+    attributes, which :py:meth:`reset_counters` sets back to zero.
+    """
+
+    def __init__(self, *devices: TMP117Emulator):
+        self.devices = {device.address: device for device in devices}
+        self._locked = False
+        self.transactions = 0
+        self.bytes_transferred = 0
+        self.locks = 0
+
+    def reset_counters(self) -> None:
+        """Set the traffic counters to zero"""
+        self.transactions = 0
+        self.bytes_transferred = 0
+        self.locks = 0
+
+    def try_lock(self) -> bool:
+        """Lock the bus if it isn't already locked"""
+        if self._locked:
+            return False
+        self._locked = True
+        self.locks += 1
+        return True
+
+    def unlock(self) -> None:
+        """Release the bus lock"""
+        self._locked = False
+
+    def scan(self) -> list:
+        """The addresses of the devices on the bus"""
+        return sorted(self.devices)
+
+    def writeto(
+        self, address: int, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Write ``buffer[start:end]`` to the device at ``address``"""
+        device = self._device(address)
+        if end is None:
+            end = len(buffer)
+        self._write(device, buffer, start, end)
+
+    def readfrom_into(
+        self, address: int, buffer: WriteableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Read into ``buffer[start:end]`` from the device at ``address``"""
+        device = self._device(address)
+        if end is None:
+            end = len(buffer)
+        self._read(device, buffer, start, end)
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        out_buffer: ReadableBuffer,
+        in_buffer: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write ``out_buffer[out_start:out_end]`` then read into ``in_buffer[in_start:in_end]``
+        with a repeated start"""
+        device = self._device(address)
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        self._write(device, out_buffer, out_start, out_end)
+        self._read(device, in_buffer, in_start, in_end)
+
+    def _device(self, address: int) -> TMP117Emulator:
+        if not self._locked:
+            raise RuntimeError("The I2C bus must be locked")
+        device = self.devices.get(address)
+        if device is None:
+            raise OSError(19, f"No device at address 0x{address:02x}")
+        self.transactions += 1
+        return device
+
+    def _write(self, device: TMP117Emulator, buffer: ReadableBuffer, start: int, end: int) -> None:
+        self.bytes_transferred += end - start
+        if end > start:
+            device.pointer = buffer[start]
+        if end - start >= 3:
+            device.write_register(device.pointer, buffer[start + 1] << 8 | buffer[start + 2])
+
+    def _read(self, device: TMP117Emulator, buffer: WriteableBuffer, start: int, end: int) -> None:
+        self.bytes_transferred += end - start
+        for index in range(start, end, 2):
+            value = device.read_register(device.pointer)
+            buffer[index] = value >> 8
+            if index + 1 < end:
+                buffer[index + 1] = value & 0xFF
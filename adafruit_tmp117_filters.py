@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_filters`
+================================================================================
+
+Streaming filters for TI TMP117 Temperature sensor readings, for trading noise against latency
+more finely than the sensor's four `averaged_measurements
+<adafruit_tmp117.TMP117.averaged_measurements>` settings allow, and `plan_filter` to choose a
+combination of averaging and filter that meets a noise and latency target.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from collections import namedtuple
+
+from adafruit_tmp117 import CONVERSION_TIME, MIN_CYCLE_TIME, AverageCount, MeasurementDelay
+from adafruit_tmp117_planner import SINGLE_CONVERSION_NOISE
+
+try:
+    from typing import Optional, Union
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+# the longest moving median window plan_filter will suggest
+_MAX_MEDIAN_SIZE = 255
+# the smallest smoothing factor plan_filter will suggest
+_MIN_ALPHA = 1 / 1024
+
+
+class ExponentialFilter:
+    """An exponential moving average. Each output moves ``alpha`` of the way from the previous
+    output towards the new reading.
+
+    :param float alpha: The smoothing factor, from 0 to 1. Smaller values filter more noise
+        but respond more slowly
+    """
+
+    def __init__(self, alpha: float):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be greater than 0 and at most 1")
+        self.alpha = alpha
+        self.value = None
+
+    def update(self, reading: float) -> float:
+        """Add a reading, returning the filtered value"""
+        if self.value is None:
+            self.value = reading
+        else:
+            self.value += self.alpha * (reading - self.value)
+        return self.value
+
+    def reset(self) -> None:
+        """Forget all readings"""
+        self.value = None
+
+
+class MedianFilter:
+    """The median of the most recent ``size`` readings. Unlike an average, single readings that
+    are far off, such as from a disturbed bus, have no effect on the output.
+
+    :param int size: The number of readings to take the median of
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.value = None
+        self._readings = [0.0] * size
+        self._sorted = []
+        self._next = 0
+
+    def update(self, reading: float) -> float:
+        """Add a reading, returning the filtered value"""
+        ordered = self._sorted
+        if len(ordered) == self.size:
+            ordered.remove(self._readings[self._next])
+        self._readings[self._next] = reading
+        self._next = (self._next + 1) % self.size
+        index = len(ordered)
+        while index and ordered[index - 1] > reading:
+            index -= 1
+        ordered.insert(index, reading)
+
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            self.value = ordered[middle]
+        else:
+            self.value = (ordered[middle - 1] + ordered[middle]) / 2
+        return self.value
+
+    def reset(self) -> None:
+        """Forget all readings"""
+        self.value = None
+        self._sorted = []
+        self._next = 0
+
+
+class KalmanFilter:
+    """A one dimensional Kalman filter that models the temperature as a random walk. It starts
+    out trusting new readings and settles to weighting them by how much the temperature is
+    expected to change between readings compared to the noise of each reading.
+
+    :param float process_noise: The expected variance of the change in temperature between
+        readings, in degrees Celsius squared
+    :param float measurement_noise: The variance of a reading in degrees Celsius squared, the
+        square of its RMS noise
+    """
+
+    def __init__(self, process_noise: float, measurement_noise: float):
+        if process_noise < 0 or measurement_noise <= 0:
+            raise ValueError("noise variances must be positive")
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.value = None
+        self.variance = None
+
+    def update(self, reading: float) -> float:
+        """Add a reading, returning the filtered value"""
+        if self.value is None:
+            self.value = reading
+            self.variance = self.measurement_noise
+            return self.value
+        variance = self.variance + self.process_noise
+        gain = variance / (variance + self.measurement_noise)
+        self.value += gain * (reading - self.value)
+        self.variance = (1 - gain) * variance
+        return self.value
+
+    def reset(self) -> None:
+        """Forget all readings"""
+        self.value = None
+        self.variance = None
+
+
+FilterPlan = namedtuple(
+    "FilterPlan", ["averaged_measurements", "filter", "cycle_time", "noise", "latency"]
+)
+"""A combination of averaging and filter chosen by `plan_filter`:
+
+* ``averaged_measurements``: an `AverageCount <adafruit_tmp117.AverageCount>`
+* ``filter``: a new filter to pass readings through, or `None` if averaging alone is enough
+* ``cycle_time``: the time between readings in continuous mode, in seconds
+* ``noise``: the estimated RMS noise of the filtered readings in degrees Celsius
+* ``latency``: the estimated delay of the filtered readings behind the temperature, in seconds
+"""
+
+
+def _exponential(noise: float, reading_noise: float) -> Optional[ExponentialFilter]:
+    # an exponential moving average scales the variance by alpha / (2 - alpha)
+    ratio = (noise / reading_noise) ** 2
+    alpha = 2 * ratio / (1 + ratio)
+    if alpha < _MIN_ALPHA or alpha >= 1:
+        return None
+    return ExponentialFilter(alpha)
+
+
+def _median(noise: float, reading_noise: float) -> Optional[MedianFilter]:
+    # the median of n readings with normally distributed noise has about pi / 2n times
+    # the variance of one reading
+    size = int(1.5707963 * (reading_noise / noise) ** 2) + 1
+    size += 1 - size % 2
+    if size == 1 or size > _MAX_MEDIAN_SIZE:
+        return None
+    return MedianFilter(size)
+
+
+def _filter_noise_and_lag(
+    candidate: Union[ExponentialFilter, MedianFilter, None], reading_noise: float
+):
+    # the noise of the output, and its delay in readings
+    if isinstance(candidate, ExponentialFilter):
+        alpha = candidate.alpha
+        return reading_noise * (alpha / (2 - alpha)) ** 0.5, (1 - alpha) / alpha
+    if isinstance(candidate, MedianFilter):
+        return reading_noise * (1.5707963 / candidate.size) ** 0.5, (candidate.size - 1) / 2
+    return reading_noise, 0
+
+
+def plan_filter(
+    noise: float,
+    latency: Optional[float] = None,
+    interval: Optional[float] = None,
+    sensor: Optional[TMP117] = None,
+) -> FilterPlan:
+    """Find a combination of `averaged_measurements
+    <adafruit_tmp117.TMP117.averaged_measurements>` and a host side filter that meets the given
+    targets, and set up ``sensor`` for it if one is given. Each averaging setting is considered
+    with the shortest measurement delay, alone and with an `ExponentialFilter` or a
+    `MedianFilter` sized to just meet the noise target.
+
+    Noise is estimated from `SINGLE_CONVERSION_NOISE
+    <adafruit_tmp117_planner.SINGLE_CONVERSION_NOISE>`. Latency is how far the readings lag
+    behind the temperature: half the averaging time plus the filter's delay.
+
+    :param float noise: The highest acceptable RMS noise in degrees Celsius
+    :param float latency: The longest acceptable latency in seconds, or `None` for no limit
+    :param float interval: The longest acceptable time between readings in seconds, or `None`
+        for no limit
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to configure, or `None` to only plan
+    :return: the chosen `FilterPlan`: the one with the least latency, and of those within 2%
+        of it the one with the fewest readings to filter
+    :raises ValueError: if no combination meets the targets
+
+    .. code-block::python
+
+        from adafruit_tmp117_filters import plan_filter
+
+        # as quiet as 64x averaging, with a new reading every 125ms
+        plan = plan_filter(0.00075, interval=0.125, sensor=tmp117)
+        print(plan.averaged_measurements, plan.filter, plan.latency)
+        for sample in tmp117.samples():
+            # filter is None when averaging alone is quiet enough
+            if plan.filter is not None:
+                print(plan.filter.update(sample.temperature))
+            else:
+                print(sample.temperature)
+
+    """
+    if noise <= 0:
+        raise ValueError("noise must be positive")
+
+    best = None
+    for averaging, count in enumerate(AverageCount.string):
+        conversion_time = count * CONVERSION_TIME
+        cycle_time = MIN_CYCLE_TIME[averaging]
+        if interval is not None and cycle_time > interval:
+            continue
+        reading_noise = SINGLE_CONVERSION_NOISE / count**0.5
+        for candidate in (
+            None,
+            _exponential(noise, reading_noise),
+            _median(noise, reading_noise),
+        ):
+            filter_noise, lag = _filter_noise_and_lag(candidate, reading_noise)
+            # allow for rounding in the noise the filter was sized for
+            if filter_noise > noise * 1.000001:
+                continue
+            plan_latency = conversion_time / 2 + lag * cycle_time
+            if latency is not None and plan_latency > latency:
+                continue
+            # averaging in hardware or on the host gives about the same latency for the same
+            # noise, so latencies within 2% count as a tie, won by the fewer readings
+            if (
+                best is None
+                or plan_latency < best.latency * 0.98
+                or (plan_latency <= best.latency * 1.02 and cycle_time > best.cycle_time)
+            ):
+                best = FilterPlan(averaging, candidate, cycle_time, filter_noise, plan_latency)
+    if best is None:
+        raise ValueError("No combination of averaging and filter meets the targets")
+
+    if sensor is not None:
+        sensor.configure(
+            averaging=best.averaged_measurements,
+            delay=MeasurementDelay.DELAY_0_0015_S,
+        )
+    return best
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_group`
+================================================================================
+
+Take simultaneous measurements from several TI TMP117 Temperature sensors
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+import time
+from collections import namedtuple
+
+from adafruit_tmp117 import MeasurementMode
+
+try:
+    from typing import Optional, Sequence
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+GroupMeasurement = namedtuple("GroupMeasurement", ["temperatures", "timestamps", "skew"])
+"""The result of :py:meth:`TMP117Group.take_single_measurement`. ``temperatures`` and
+``timestamps`` are lists in the same order as the group's sensors. Each timestamp is the
+`time.monotonic` value when that sensor's measurement was found to be ready, and ``skew`` is
+the spread between the earliest and latest timestamp in seconds."""
+
+
+class TMP117Group:
+    """Several `TMP117 <adafruit_tmp117.TMP117>` sensors that are measured together. The
+    sensors may be on different addresses or different buses.
+
+    :param sensors: The sensors in the group
+
+    .. code-block::python
+
+        import board
+        from adafruit_tmp117 import TMP117
+        from adafruit_tmp117_group import TMP117Group
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+
+        group = TMP117Group([TMP117(i2c, address) for address in (0x48, 0x49, 0x4A, 0x4B)])
+        measurement = group.take_single_measurement()
+        print(measurement.temperatures, "skew:", measurement.skew)
+
+    """
+
+    def __init__(self, sensors: Sequence[TMP117]):
+        self.sensors = list(sensors)
+        if not self.sensors:
+            raise ValueError("A TMP117Group needs at least one sensor")
+
+    def take_single_measurement(self) -> GroupMeasurement:
+        """Start a single measurement on every sensor, then collect each result as soon as it
+        is ready. The whole group takes about as long as its slowest sensor's
+        `conversion_time <adafruit_tmp117.TMP117.conversion_time>`, regardless of how many
+        sensors it has."""
+        return self._measure()
+
+    def _measure(self, starts: Optional[Sequence[float]] = None) -> GroupMeasurement:
+        # start each sensor's one shot at its `time.monotonic` value in ``starts``, or all of
+        # them now, and collect each result as soon as it is ready
+        sensors = self.sensors
+        now = time.monotonic()
+        due = list(starts) if starts is not None else [now] * len(sensors)
+        waits = [None] * len(sensors)
+
+        temperatures = [None] * len(sensors)
+        timestamps = [None] * len(sensors)
+        pending = list(range(len(sensors)))
+        while pending:
+            delay = min(due[index] for index in pending) - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            now = time.monotonic()
+            starting = [index for index in pending if waits[index] is None and due[index] <= now]
+            for index in starting:
+                sensors[index]._mode = MeasurementMode.ONE_SHOT
+            # none of the conversions can have finished yet, so this only clears stale flags
+            for index in starting:
+                sensor = sensors[index]
+                sensor._read_status()
+                waits[index] = sensor._data_ready_delays(sensor.conversion_time)
+
+            # each sensor's own data ready backoff, each stepped only once its own delay is over
+            for index in pending[:]:
+                if waits[index] is None or due[index] > now:
+                    continue
+                try:
+                    due[index] = time.monotonic() + next(waits[index])
+                except StopIteration:
+                    timestamps[index] = time.monotonic()
+                    temperatures[index] = sensors[index]._read_temperature()
+                    pending.remove(index)
+
+        return GroupMeasurement(temperatures, timestamps, max(timestamps) - min(timestamps))
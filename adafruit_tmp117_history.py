@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_history`
+================================================================================
+
+A fixed size history of TI TMP117 Temperature sensor readings for on-device trending. Readings
+are kept as the sensor's raw 16-bit values, two bytes each, and are only converted to degrees
+Celsius when asked for.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from array import array
+
+from adafruit_tmp117 import _TMP117_RESOLUTION  # noqa: PLC2701
+
+try:
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+
+class TemperatureHistory:
+    """The most recent ``capacity`` readings from a `TMP117 <adafruit_tmp117.TMP117>`. The
+    storage is allocated once, and the sum, minimum and maximum are kept up to date as readings
+    are added, so recording a reading never allocates.
+
+    :param int capacity: The number of readings to keep. Once full, each new reading replaces
+        the oldest one
+
+    .. code-block::python
+
+        import time
+        import board
+        from adafruit_tmp117 import TMP117
+        from adafruit_tmp117_history import TemperatureHistory
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        tmp117 = TMP117(i2c)
+        history = TemperatureHistory(600)
+
+        while True:
+            history.record(tmp117)
+            print(history.minimum, history.mean, history.maximum)
+            time.sleep(1)
+
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._buffer = array("h", bytes(2 * capacity))
+        self._capacity = capacity
+        self._next = 0
+        self._count = 0
+        self._sum = 0
+        self._min = 0
+        self._max = 0
+        self._extremes_stale = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> float:
+        """The reading at ``index`` in degrees Celsius, oldest first"""
+        return self.raw(index) * _TMP117_RESOLUTION
+
+    def raw(self, index: int) -> int:
+        """The raw reading at ``index``, oldest first. Negative indices count back from the
+        most recent reading."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("history index out of range")
+        return self._buffer[(self._next - self._count + index) % self._capacity]
+
+    def record(self, sensor: TMP117) -> None:
+        """Read the current temperature from ``sensor`` and add it to the history"""
+        self.append_raw(sensor.raw_temperature)
+
+    def append_raw(self, raw: int) -> None:
+        """Add a raw reading, as stored in the sensor's temperature register"""
+        buffer = self._buffer
+        position = self._next
+        if self._count == self._capacity:
+            evicted = buffer[position]
+            self._sum -= evicted
+            # the extreme being dropped may be the only one, so find it again when next needed
+            if evicted <= self._min or evicted >= self._max:
+                self._extremes_stale = True
+        else:
+            self._count += 1
+        buffer[position] = raw
+        self._sum += raw
+        self._next = (position + 1) % self._capacity
+
+        if self._count == 1:
+            self._min = self._max = raw
+        elif not self._extremes_stale:
+            self._min = min(raw, self._min)
+            self._max = max(raw, self._max)
+
+    def clear(self) -> None:
+        """Remove all readings"""
+        self._next = 0
+        self._count = 0
+        self._sum = 0
+        self._extremes_stale = False
+
+    @property
+    def raw_sum(self) -> int:
+        """The sum of the raw readings"""
+        return self._sum
+
+    @property
+    def raw_minimum(self) -> int:
+        """The lowest raw reading"""
+        self._update_extremes()
+        return self._min
+
+    @property
+    def raw_maximum(self) -> int:
+        """The highest raw reading"""
+        self._update_extremes()
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        """The mean of the readings in degrees Celsius"""
+        self._check_not_empty()
+        return self._sum * _TMP117_RESOLUTION / self._count
+
+    @property
+    def minimum(self) -> float:
+        """The lowest reading in degrees Celsius"""
+        return self.raw_minimum * _TMP117_RESOLUTION
+
+    @property
+    def maximum(self) -> float:
+        """The highest reading in degrees Celsius"""
+        return self.raw_maximum * _TMP117_RESOLUTION
+
+    def _check_not_empty(self) -> None:
+        if not self._count:
+            raise ValueError("history is empty")
+
+    def _update_extremes(self) -> None:
+        self._check_not_empty()
+        if not self._extremes_stale:
+            return
+        # readings are only evicted once the buffer is full, so every slot holds a reading
+        self._min = min(self._buffer)
+        self._max = max(self._buffer)
+        self._extremes_stale = False
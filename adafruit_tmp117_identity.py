@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_identity`
+================================================================================
+
+The model, part ID and factory-set serial number of TI TMP117 and TMP119 Temperature sensors,
+read once per bus and address. This implements `TMP117.identity
+<adafruit_tmp117.TMP117.identity>` and :py:meth:`TMP117.refresh_identity
+<adafruit_tmp117.TMP117.refresh_identity>`.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from collections import namedtuple
+
+from adafruit_tmp117 import (
+    _DEVICE_ID,  # noqa: PLC2701
+    _EEPROM1,  # noqa: PLC2701
+    _EEPROM2,  # noqa: PLC2701
+    _EEPROM3,  # noqa: PLC2701
+    _TMP119_ID_VALUE,  # noqa: PLC2701
+)
+
+try:
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+DeviceIdentity = namedtuple("DeviceIdentity", ["model", "part_id", "serial_number"])
+"""The identity of a sensor, as returned by `identity`:
+
+* ``model``: ``"TMP117"`` or ``"TMP119"``
+* ``part_id``: the value of the device ID register
+* ``serial_number``: the 48-bit factory-set unique identifier, as in `serial_number
+  <adafruit_tmp117.TMP117.serial_number>`
+"""
+
+# identities already read, by bus and address, so sensors created again on the same bus and
+# address don't read them again
+_identities = {}
+
+
+def identity(sensor: TMP117) -> DeviceIdentity:
+    """The identity of ``sensor``. It is read from the sensor the first time it is needed and
+    then cached, both on the `TMP117 <adafruit_tmp117.TMP117>` and for any later one created
+    with the same bus and address. Use `refresh_identity` if the sensor at that address may have
+    been replaced.
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to identify
+    """
+    if sensor._identity is None:
+        key = (sensor.i2c_device.i2c, sensor.i2c_device.device_address)
+        known = _identities.get(key)
+        if known is None:
+            known = refresh_identity(sensor)
+        sensor._identity = known
+    return sensor._identity
+
+
+def refresh_identity(sensor: TMP117) -> DeviceIdentity:
+    """Read the identity of ``sensor`` again, updating the cached `identity`
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to identify
+    """
+    with sensor.locked():
+        part_id = sensor._read_register(_DEVICE_ID)
+        serial_number = sensor._read_register(_EEPROM1)
+        serial_number = serial_number << 16 | sensor._read_register(_EEPROM2)
+        serial_number = serial_number << 16 | sensor._read_register(_EEPROM3)
+    model = "TMP119" if part_id == _TMP119_ID_VALUE else "TMP117"
+    read_identity = DeviceIdentity(model, part_id, serial_number)
+    _identities[sensor.i2c_device.i2c, sensor.i2c_device.device_address] = read_identity
+    sensor._identity = read_identity
+    return read_identity
@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_instrumentation`
+================================================================================
+
+Opt-in measurement of the I2C traffic and waiting done by a TI TMP117 Temperature sensor
+driver. Instrumentation is attached to a sensor object at runtime by wrapping its I2C device
+and wait helpers, so a sensor without it attached runs exactly the same code as before.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+import time
+
+try:
+    from typing import Callable, Optional
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+
+class Histogram:
+    """A histogram of durations in microseconds with power of two buckets. Bucket ``n`` counts
+    durations from ``2 ** (n - 1)`` up to ``2 ** n`` microseconds, and the last bucket also
+    counts everything longer.
+
+    :param int buckets: The number of buckets. The default of 24 reaches about 8 seconds
+    """
+
+    def __init__(self, buckets: int = 24):
+        self.counts = [0] * buckets
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+
+    def add(self, microseconds: int) -> None:
+        """Record a duration"""
+        self.counts[min(microseconds.bit_length(), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += microseconds
+        self.maximum = max(self.maximum, microseconds)
+
+    @property
+    def mean(self) -> float:
+        """The mean duration in microseconds"""
+        return self.total / self.count if self.count else 0.0
+
+
+class Instrumentation:
+    """Counters and histograms for one or more `TMP117 <adafruit_tmp117.TMP117>` objects.
+
+    * ``locks``: the number of times the I2C bus was locked
+    * ``transactions``: the number of I2C transactions
+    * ``bytes``: the number of bytes written and read
+    * ``waits``: the number of times the driver waited for a measurement
+    * ``polls``: the number of status reads made while waiting
+    * ``timeouts``: the number of waits that gave up
+    * ``transaction_times``: a `Histogram` of I2C transaction times
+    * ``wait_times``: a `Histogram` of the time spent waiting for measurements
+
+    :param callback: An optional callable that is called with the name of each event,
+        ``"transaction"`` or ``"wait"``, the sensor, and its duration in microseconds
+
+    .. code-block::python
+
+        from adafruit_tmp117_instrumentation import Instrumentation
+
+        instrumentation = Instrumentation()
+        instrumentation.attach(tmp117)
+        tmp117.take_single_measurement()
+        print(instrumentation.transactions, "transactions,", instrumentation.polls, "polls")
+        print("mean I2C time:", instrumentation.transaction_times.mean, "us")
+        instrumentation.detach(tmp117)
+
+    """
+
+    def __init__(self, callback: Optional[Callable[[str, TMP117, int], None]] = None):
+        self.callback = callback
+        self.reset()
+
+    def reset(self) -> None:
+        """Set all counters and histograms back to zero"""
+        self.locks = 0
+        self.transactions = 0
+        self.bytes = 0
+        self.waits = 0
+        self.polls = 0
+        self.timeouts = 0
+        self.transaction_times = Histogram()
+        self.wait_times = Histogram()
+
+    def attach(self, sensor: TMP117) -> None:
+        """Start recording the I2C traffic and waits of ``sensor``"""
+        if isinstance(sensor.i2c_device, _InstrumentedDevice):
+            raise RuntimeError("The sensor is already instrumented")
+        sensor.i2c_device = _InstrumentedDevice(sensor.i2c_device, sensor, self)
+        # instance attributes shadow the class's methods until detached
+        sensor._data_ready_delays = self._wrap_delays(sensor, sensor._data_ready_delays)
+        sensor._wait_for_data_ready = self._wrap_wait(sensor, sensor._wait_for_data_ready)
+
+    def detach(self, sensor: TMP117) -> None:
+        """Stop recording ``sensor``, returning it to running without instrumentation"""
+        device = sensor.i2c_device
+        if not isinstance(device, _InstrumentedDevice) or device.instrumentation is not self:
+            raise RuntimeError("The sensor is not instrumented by this object")
+        sensor.i2c_device = device.device
+        del sensor._data_ready_delays
+        del sensor._wait_for_data_ready
+
+    def _record(self, event: str, sensor: TMP117, start: int) -> None:
+        microseconds = (time.monotonic_ns() - start) // 1000
+        if event == "wait":
+            self.waits += 1
+            self.polls += sensor.data_ready_polls
+            self.wait_times.add(microseconds)
+        else:
+            self.transactions += 1
+            self.transaction_times.add(microseconds)
+        if self.callback is not None:
+            self.callback(event, sensor, microseconds)
+
+    def _wrap_delays(self, sensor: TMP117, data_ready_delays: Callable):
+        def delays(*args, **kwargs):
+            start = time.monotonic_ns()
+            try:
+                yield from data_ready_delays(*args, **kwargs)
+            except RuntimeError:
+                self.timeouts += 1
+                raise
+            self._record("wait", sensor, start)
+
+        return delays
+
+    def _wrap_wait(self, sensor: TMP117, wait_for_data_ready: Callable):
+        def wait(expected: float, spread: float = 0.0) -> None:
+            if sensor._pin_wait is None:
+                # polling is recorded by the wrapped delays
+                wait_for_data_ready(expected, spread)
+                return
+            start = time.monotonic_ns()
+            try:
+                wait_for_data_ready(expected, spread)
+            except RuntimeError:
+                self.timeouts += 1
+                raise
+            self._record("wait", sensor, start)
+
+        return wait
+
+
+class _InstrumentedDevice:
+    """Wraps an `adafruit_bus_device.i2c_device.I2CDevice`, recording each transaction"""
+
+    def __init__(self, device, sensor: TMP117, instrumentation: Instrumentation):
+        self.device = device
+        self.sensor = sensor
+        self.instrumentation = instrumentation
+
+    def __getattr__(self, name: str):
+        return getattr(self.device, name)
+
+    def __enter__(self) -> "_InstrumentedDevice":
+        self.device.__enter__()
+        self.instrumentation.locks += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return self.device.__exit__(exc_type, exc_value, traceback)
+
+    def readinto(self, buf, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Read into ``buf`` from the device"""
+        if end is None:
+            end = len(buf)
+        begin = time.monotonic_ns()
+        self.device.readinto(buf, start=start, end=end)
+        self.instrumentation.bytes += end - start
+        self.instrumentation._record("transaction", self.sensor, begin)
+
+    def write(self, buf, *, start: int = 0, end: Optional[int] = None) -> None:
+        """Write ``buf`` to the device"""
+        if end is None:
+            end = len(buf)
+        begin = time.monotonic_ns()
+        self.device.write(buf, start=start, end=end)
+        self.instrumentation.bytes += end - start
+        self.instrumentation._record("transaction", self.sensor, begin)
+
+    def write_then_readinto(
+        self,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Write ``out_buffer`` then read into ``in_buffer`` with a repeated start"""
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        begin = time.monotonic_ns()
+        self.device.write_then_readinto(
+            out_buffer,
+            in_buffer,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        self.instrumentation.bytes += out_end - out_start + in_end - in_start
+        self.instrumentation._record("transaction", self.sensor, begin)
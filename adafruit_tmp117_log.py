@@ -0,0 +1,261 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_log`
+================================================================================
+
+A compact, append-only binary log of TI TMP117 Temperature sensor readings. Each reading takes
+four bytes: the raw 16-bit temperature register value and the time since the previous reading.
+
+The file starts with a 40 byte header, followed by the readings. All values are little endian.
+
++--------+------+-------------------------------------------------------------------+
+| Offset | Size | Contents                                                          |
++========+======+===================================================================+
+| 0      | 8    | ``b"TMP117LG"``                                                   |
++--------+------+-------------------------------------------------------------------+
+| 8      | 2    | format version, 1                                                 |
++--------+------+-------------------------------------------------------------------+
+| 10     | 2    | header size in bytes, 40                                          |
++--------+------+-------------------------------------------------------------------+
+| 12     | 8    | sensor serial number                                              |
++--------+------+-------------------------------------------------------------------+
+| 20     | 2    | sensor part ID                                                    |
++--------+------+-------------------------------------------------------------------+
+| 22     | 2    | sensor CONFIGURATION register settings                            |
++--------+------+-------------------------------------------------------------------+
+| 24     | 8    | start time in seconds, a double                                   |
++--------+------+-------------------------------------------------------------------+
+| 32     | 4    | time unit of the reading deltas in microseconds                   |
++--------+------+-------------------------------------------------------------------+
+| 36     | 4    | reserved                                                          |
++--------+------+-------------------------------------------------------------------+
+
+Each reading is a signed 16-bit raw temperature followed by an unsigned 16-bit count of time
+units since the previous reading, or since the start time for the first one. Gaps too long for
+one delta are filled with readings of ``-32768``, the sensor's "no measurement" value, each
+with the largest delta.
+
+**Software and Dependencies:**
+
+* NumPy, for `LogReader`: https://numpy.org
+
+"""
+
+import struct
+
+try:
+    import mmap
+
+    import numpy as np
+except ImportError:
+    mmap = None
+    np = None
+
+try:
+    from typing import BinaryIO, Optional, Tuple
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+_MAGIC = b"TMP117LG"
+_VERSION = 1
+_HEADER = "<8sHHQHHdII"
+_HEADER_SIZE = struct.calcsize(_HEADER)
+_RECORD = "<hH"
+_RECORD_SIZE = struct.calcsize(_RECORD)
+_MAX_DELTA = 0xFFFF
+
+NO_READING = -0x8000
+"""The raw value of the padding readings that fill gaps longer than one delta"""
+
+
+class LogWriter:
+    """Appends readings to a log in a file opened for binary writing. The header is written
+    once the start time is known, and each reading is packed into a buffer that is reused, so
+    recording does not allocate memory.
+
+    :param file: A file opened for binary writing, positioned at its start
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` whose identity and configuration are
+        recorded in the header, and that :py:meth:`record` reads from
+    :param float start_time: The time the deltas are counted from, in seconds. Defaults to the
+        time of the first reading
+    :param float time_unit: The unit of the time deltas in seconds. The default of 1ms allows
+        up to about 65 seconds between readings before gap padding is needed
+
+    .. code-block::python
+
+        import time
+        import board
+        from adafruit_tmp117 import TMP117
+        from adafruit_tmp117_log import LogWriter
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        tmp117 = TMP117(i2c)
+
+        with open("/sd/temperature.log", "wb") as file:
+            log = LogWriter(file, tmp117)
+            while True:
+                log.record(time.time())
+                time.sleep(1)
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        sensor: TMP117,
+        start_time: Optional[float] = None,
+        time_unit: float = 0.001,
+    ):
+        self._file = file
+        self._sensor = sensor
+        self._time_unit = time_unit
+        self._start_time = start_time
+        # time is tracked in whole units from the start so rounding doesn't accumulate
+        self._elapsed_units = 0
+        self._record = bytearray(_RECORD_SIZE)
+        identity = sensor.identity
+        self._header = (identity.serial_number, identity.part_id, sensor._config)
+        if start_time is not None:
+            self._write_header()
+
+    def _write_header(self) -> None:
+        serial_number, part_id, config = self._header
+        self._file.write(
+            struct.pack(
+                _HEADER,
+                _MAGIC,
+                _VERSION,
+                _HEADER_SIZE,
+                serial_number,
+                part_id,
+                config,
+                self._start_time,
+                round(self._time_unit * 1_000_000),
+                0,
+            )
+        )
+
+    def record(self, timestamp: float) -> None:
+        """Read the temperature from the sensor and append it as taken at ``timestamp``"""
+        self.append(self._sensor.raw_temperature, timestamp)
+
+    def append(self, raw: int, timestamp: float) -> None:
+        """Append a raw temperature reading taken at ``timestamp`` seconds"""
+        if self._start_time is None:
+            self._start_time = timestamp
+            self._write_header()
+        delta = round((timestamp - self._start_time) / self._time_unit) - self._elapsed_units
+        if delta < 0:
+            raise ValueError("readings must be appended in time order")
+        while delta > _MAX_DELTA:
+            self._write_record(NO_READING, _MAX_DELTA)
+            delta -= _MAX_DELTA
+        self._write_record(raw, delta)
+
+    def _write_record(self, raw: int, delta: int) -> None:
+        struct.pack_into(_RECORD, self._record, 0, raw, delta)
+        self._file.write(self._record)
+        self._elapsed_units += delta
+
+    def flush(self) -> None:
+        """Flush the file"""
+        self._file.flush()
+
+
+class LogReader:
+    """Reads a log by memory mapping it, so opening is instant regardless of its size and the
+    readings are returned as NumPy arrays that share the file's memory rather than copies.
+    Requires NumPy.
+
+    :param str path: The path of the log file
+
+    .. code-block::python
+
+        from adafruit_tmp117_log import LogReader
+
+        with LogReader("temperature.log") as log:
+            print("Serial number:", hex(log.serial_number))
+            # between() leaves out the padding that fills gaps in the readings
+            raw, times = log.between(log.start_time + 3600, log.start_time + 7200)
+            if len(raw):
+                print(raw.mean() * 0.0078125, "degrees C in the second hour")
+    """
+
+    def __init__(self, path: str):
+        if np is None:
+            raise RuntimeError("LogReader requires NumPy")
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            header_size,
+            self.serial_number,
+            self.part_id,
+            self.config,
+            self.start_time,
+            time_unit,
+            _,
+        ) = struct.unpack_from(_HEADER, self._map)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a TMP117 log")
+        self.time_unit = time_unit / 1_000_000
+        count = (len(self._map) - header_size) // _RECORD_SIZE
+        self._records = np.frombuffer(
+            self._map,
+            dtype=np.dtype([("raw", "<i2"), ("delta", "<u2")]),
+            count=count,
+            offset=header_size,
+        )
+        self._times = None
+
+    def __enter__(self) -> "LogReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Release the memory map. If arrays returned by the reader are still in use, the map is
+        released along with the last of them instead."""
+        self._records = None
+        self._times = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def raw(self) -> "np.ndarray":
+        """All raw readings, including any `NO_READING` padding, as a view of the file. Use
+        :py:meth:`between` for the readings without padding"""
+        return self._records["raw"]
+
+    @property
+    def times(self) -> "np.ndarray":
+        """The time of each reading in seconds. These are computed from the deltas the first
+        time they are needed and then kept."""
+        if self._times is None:
+            units = np.cumsum(self._records["delta"], dtype=np.int64)
+            self._times = self.start_time + units * self.time_unit
+        return self._times
+
+    def between(self, start: float, end: float) -> Tuple["np.ndarray", "np.ndarray"]:
+        """The raw readings and their times from ``start`` up to but not including ``end``
+        seconds, leaving out the `NO_READING` padding. The raw readings are a view of the file
+        unless padding had to be left out."""
+        times = self.times
+        first, last = np.searchsorted(times, (start, end))
+        raw = self.raw[first:last]
+        times = times[first:last]
+        valid = raw != NO_READING
+        if valid.all():
+            return raw, times
+        return raw[valid], times[valid]
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_planner`
+================================================================================
+
+Choose `averaged_measurements <adafruit_tmp117.TMP117.averaged_measurements>` and
+`measurement_delay <adafruit_tmp117.TMP117.measurement_delay>` for a TI TMP117 Temperature sensor
+from a target reading interval, noise level or power use.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from collections import namedtuple
+
+from adafruit_tmp117 import CONVERSION_TIME, MIN_CYCLE_TIME, AverageCount, MeasurementDelay
+
+try:
+    from typing import Optional
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+# an estimate of the RMS noise of a single conversion in degrees Celsius, assumed to fall with
+# the square root of the number of averaged conversions
+SINGLE_CONVERSION_NOISE = 0.006
+
+MeasurementPlan = namedtuple(
+    "MeasurementPlan",
+    [
+        "averaged_measurements",
+        "measurement_delay",
+        "cycle_time",
+        "conversions_per_second",
+        "noise",
+        "duty_cycle",
+    ],
+)
+"""A combination of settings chosen by `plan_measurements`:
+
+* ``averaged_measurements``: an `AverageCount <adafruit_tmp117.AverageCount>`
+* ``measurement_delay``: a `MeasurementDelay <adafruit_tmp117.MeasurementDelay>`
+* ``cycle_time``: the effective time between readings in continuous mode, in seconds
+* ``conversions_per_second``: the number of new readings per second
+* ``noise``: the estimated RMS noise of each reading in degrees Celsius
+* ``duty_cycle``: the fraction of the time the sensor spends converting, which sets its power use
+"""
+
+# how plans that meet the targets are ranked
+_PREFERENCES = {
+    "power": lambda plan: (plan.duty_cycle, plan.noise),
+    "noise": lambda plan: (plan.noise, plan.duty_cycle),
+    "latency": lambda plan: (plan.cycle_time, plan.noise),
+}
+
+
+def _plans():
+    for averaging, count in enumerate(AverageCount.string):
+        conversion_time = count * CONVERSION_TIME
+        for delay, delay_time in enumerate(MeasurementDelay.string):
+            cycle_time = max(delay_time, MIN_CYCLE_TIME[averaging])
+            yield MeasurementPlan(
+                averaging,
+                delay,
+                cycle_time,
+                1 / cycle_time,
+                SINGLE_CONVERSION_NOISE / count**0.5,
+                conversion_time / cycle_time,
+            )
+
+
+def plan_measurements(
+    sensor: Optional[TMP117] = None,
+    interval: Optional[float] = None,
+    noise: Optional[float] = None,
+    prefer: str = "power",
+) -> MeasurementPlan:
+    """Find the averaging and delay settings that meet the given targets, and apply them to
+    ``sensor`` if one is given.
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to configure, or `None` to only plan
+    :param float interval: The longest acceptable time between readings in continuous mode, in
+        seconds
+    :param float noise: The highest acceptable RMS noise in degrees Celsius. See
+        `SINGLE_CONVERSION_NOISE`
+    :param str prefer: What to optimize once the targets are met: ``"power"`` for the lowest
+        duty cycle, ``"noise"`` for the lowest noise or ``"latency"`` for the shortest cycle.
+        Defaults to ``"power"``
+    :return: the chosen `MeasurementPlan`
+    :raises ValueError: if no settings meet the targets
+
+    .. code-block::python
+
+        from adafruit_tmp117_planner import plan_measurements
+
+        # a reading at least every 250ms, with as little noise as possible
+        plan = plan_measurements(tmp117, interval=0.25, prefer="noise")
+        print(plan.cycle_time, "seconds per reading,", plan.noise, "degrees C noise")
+
+    """
+    key = _PREFERENCES.get(prefer)
+    if key is None:
+        raise ValueError("prefer must be 'power', 'noise' or 'latency'")
+
+    best = None
+    for plan in _plans():
+        if interval is not None and plan.cycle_time > interval:
+            continue
+        if noise is not None and plan.noise > noise:
+            continue
+        if best is None or key(plan) < key(best):
+            best = plan
+    if best is None:
+        raise ValueError("No combination of averaging and delay meets the targets")
+
+    if sensor is not None:
+        sensor.configure(averaging=best.averaged_measurements, delay=best.measurement_delay)
+    return best
@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_profiles`
+================================================================================
+
+Snapshots of the registers of a TI TMP117 Temperature sensor, for diagnostics and for switching
+between sets of settings with only the writes that are needed. This implements
+:py:meth:`TMP117.snapshot <adafruit_tmp117.TMP117.snapshot>` and :py:meth:`TMP117.restore
+<adafruit_tmp117.TMP117.restore>`.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+from collections import namedtuple
+
+from adafruit_tmp117 import (
+    _EEPROM3,  # noqa: PLC2701
+    _T_HIGH_LIMIT,  # noqa: PLC2701
+    _T_LOW_LIMIT,  # noqa: PLC2701
+    _TEMP_OFFSET,  # noqa: PLC2701
+    _settings,  # noqa: PLC2701
+)
+
+try:
+    from typing import Union
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+# the registers besides CONFIGURATION that `restore` writes
+_PROFILE_REGISTERS = (_T_HIGH_LIMIT, _T_LOW_LIMIT, _TEMP_OFFSET)
+
+RegisterSnapshot = namedtuple(
+    "RegisterSnapshot",
+    [
+        "configuration",
+        "high_limit",
+        "low_limit",
+        "eeprom_unlock",
+        "eeprom1",
+        "eeprom2",
+        "temperature_offset",
+        "eeprom3",
+    ],
+)
+"""The raw 16-bit values of the registers from CONFIGURATION (0x01) to EEPROM3 (0x08), as read
+by `snapshot`"""
+
+
+def snapshot(sensor: TMP117) -> RegisterSnapshot:
+    """Read every register of ``sensor`` from CONFIGURATION (0x01) to EEPROM3 (0x08) in one
+    lock of the bus, as a `RegisterSnapshot`. Snapshots can be logged for diagnostics, or kept
+    in `profiles <adafruit_tmp117.TMP117.profiles>` and switched between with `restore`.
+
+    **Note:** reading the CONFIGURATION register clears the alert and data ready flags
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to read
+
+    .. code-block::python
+
+        from adafruit_tmp117 import AverageCount, MeasurementDelay
+
+        tmp117.configure(
+            averaging=AverageCount.AVERAGE_1X, delay=MeasurementDelay.DELAY_0_0015_S
+        )
+        tmp117.profiles["fast"] = tmp117.snapshot()
+        tmp117.configure(
+            averaging=AverageCount.AVERAGE_64X, delay=MeasurementDelay.DELAY_1_S
+        )
+        tmp117.profiles["precise"] = tmp117.snapshot()
+
+        tmp117.restore("fast")
+
+    """
+    with sensor.locked():
+        registers = RegisterSnapshot(
+            sensor._read_config(),
+            *(sensor._read_register(register) for register in range(_T_HIGH_LIMIT, _EEPROM3 + 1)),
+        )
+    sensor._profile_registers = (
+        registers.high_limit,
+        registers.low_limit,
+        registers.temperature_offset,
+    )
+    return registers
+
+
+def restore(sensor: TMP117, profile: Union[RegisterSnapshot, str]) -> int:
+    """Restore the configuration, `high_limit <adafruit_tmp117.TMP117.high_limit>`, `low_limit
+    <adafruit_tmp117.TMP117.low_limit>` and `temperature_offset
+    <adafruit_tmp117.TMP117.temperature_offset>` of ``sensor`` from a `snapshot`, or from the
+    snapshot with that name in its `profiles <adafruit_tmp117.TMP117.profiles>`. The EEPROM
+    registers are not written.
+
+    Only registers that differ from the values last snapshotted or restored through the same
+    `TMP117 <adafruit_tmp117.TMP117>` are written, so switching between profiles that differ
+    only in their configuration is a single write. The configuration is written last, so that a
+    profile which starts conversions has its limits in place first.
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to restore
+    :param profile: A `RegisterSnapshot`, or the name of one in ``sensor.profiles``
+    :return: the number of registers written
+    """
+    if isinstance(profile, str):
+        profile = sensor.profiles[profile]
+    values = (profile.high_limit, profile.low_limit, profile.temperature_offset)
+    known = sensor._profile_registers or (None,) * len(values)
+    config = _settings(profile.configuration)
+    written = 0
+    with sensor.locked():
+        for register, value, old_value in zip(_PROFILE_REGISTERS, values, known):
+            if value != old_value:
+                sensor._write_register(register, value)
+                written += 1
+        if config != sensor._config:
+            sensor._write_config(config)
+            written += 1
+    sensor._profile_registers = values
+    return written
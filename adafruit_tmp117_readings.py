@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_readings`
+================================================================================
+
+Readings of a TI TMP117 Temperature sensor as named tuples: a single `read` of the temperature
+with its flags, and generators that follow the sensor in continuous mode, reading it only when
+there is something new. These implement :py:meth:`TMP117.read <adafruit_tmp117.TMP117.read>`,
+:py:meth:`TMP117.samples <adafruit_tmp117.TMP117.samples>` and :py:meth:`TMP117.watch
+<adafruit_tmp117.TMP117.watch>`.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+import time
+from collections import namedtuple
+
+from adafruit_tmp117 import (
+    _CONTINUOUS_CONVERSION_MODE,  # noqa: PLC2701
+    _TMP117_RESOLUTION,  # noqa: PLC2701
+    AlertMode,
+)
+
+try:
+    from typing import Callable, Optional
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+_WATCH_TIMEOUT = 60  # longest wait for the ALERT pin before checking the alert flags anyway
+
+Reading = namedtuple("Reading", ["temperature", "high_alert", "low_alert", "data_ready"])
+"""The temperature and flags returned by `read`:
+
+* ``temperature``: the temperature in degrees Celsius
+* ``high_alert``, ``low_alert``: the alert flags, as in `alert_status
+  <adafruit_tmp117.TMP117.alert_status>`
+* ``data_ready``: whether the temperature is from a conversion that finished since the flags
+  were last read
+"""
+
+Sample = namedtuple("Sample", ["temperature", "timestamp", "sequence", "missed"])
+"""A measurement yielded by `samples`:
+
+* ``temperature``: the measurement in degrees Celsius
+* ``timestamp``: the `time.monotonic` value when the measurement was found to be ready
+* ``sequence``: the number of the conversion, counting from 0 for the first one seen
+* ``missed``: how many conversions finished unread since the previous sample, estimated from
+  the time between them. ``sequence`` skips ahead by the same amount
+"""
+
+TemperatureChange = namedtuple("TemperatureChange", ["temperature", "previous", "timestamp"])
+"""A change yielded by `watch`:
+
+* ``temperature``: the new temperature in degrees Celsius
+* ``previous``: the temperature at the center of the window that was left
+* ``timestamp``: the `time.monotonic` value when the change was read
+"""
+
+
+def read(sensor: TMP117) -> Reading:
+    """Read the temperature together with the alert and data ready flags, as a `Reading`. See
+    :py:meth:`TMP117.readinto <adafruit_tmp117.TMP117.readinto>` for how the two are read.
+
+    **Note:** like `alert_status <adafruit_tmp117.TMP117.alert_status>`, this clears the flags
+    on the sensor
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to read
+
+    .. code-block::python
+
+        while True:
+            reading = tmp117.read()
+            if reading.data_ready:
+                print(reading.temperature, reading.high_alert, reading.low_alert)
+
+    """
+    buffer = bytearray(4)
+    sensor.readinto(buffer)
+    raw = buffer[0] << 8 | buffer[1]
+    if raw & 0x8000:
+        raw -= 0x10000
+    flags = buffer[2]
+    return Reading(
+        raw * _TMP117_RESOLUTION, bool(flags & 0x80), bool(flags & 0x40), bool(flags & 0x20)
+    )
+
+
+def samples(sensor: TMP117):
+    """Put ``sensor`` into continuous mode if it isn't already and yield each new measurement
+    exactly once as a `Sample`.
+
+    The sensor is only read once it reports new data, so the generator does one temperature
+    read per conversion rather than returning the same value repeatedly.
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to read
+
+    .. code-block::python
+
+        for sample in tmp117.samples():
+            print(sample.sequence, sample.timestamp, sample.temperature)
+
+    """
+    expected_at = time.monotonic()
+    if sensor._mode != _CONTINUOUS_CONVERSION_MODE:
+        sensor._start_conversion(_CONTINUOUS_CONVERSION_MODE)
+        expected_at += sensor.conversion_time
+        spread = 0.0
+    else:
+        # already converting, so the next conversion could finish any time within a cycle
+        spread = sensor._cycle_time
+    sequence = -1
+    last_timestamp = None
+    while True:
+        sensor._wait_for_data_ready(max(0, expected_at - time.monotonic()), spread)
+        spread = 0.0
+        timestamp = time.monotonic()
+        cycle_time = sensor._cycle_time
+        missed = 0
+        if last_timestamp is not None:
+            missed = max(0, round((timestamp - last_timestamp) / cycle_time) - 1)
+        sequence += missed + 1
+        last_timestamp = timestamp
+        expected_at = timestamp + cycle_time
+        yield Sample(sensor._read_temperature(), timestamp, sequence, missed)
+
+
+def watch(sensor: TMP117, deadband: float, wait: Optional[Callable[[float], bool]] = None):
+    """Yield a `TemperatureChange` each time the temperature moves more than ``deadband``
+    degrees Celsius away from the last reported value. The change detection is done by the
+    sensor: `high_limit <adafruit_tmp117.TMP117.high_limit>` and `low_limit
+    <adafruit_tmp117.TMP117.low_limit>` are set to a window around the last value in
+    :py:const:`AlertMode.WINDOW <adafruit_tmp117.AlertMode.WINDOW>` and the temperature is only
+    read when an alert fires, after which the window is moved to the new value.
+
+    The sensor is put into continuous mode.
+
+    :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to watch
+    :param float deadband: The amount the temperature has to change by, in degrees Celsius
+    :param wait: A callable like the one taken by
+        :py:meth:`TMP117.enable_data_ready_interrupt
+        <adafruit_tmp117.TMP117.enable_data_ready_interrupt>` that waits for the ALERT pin to
+        become active, so that the host can sleep while the temperature is stable. Without it
+        the alert flags are read once per measurement cycle, and the temperature is still only
+        read when it has changed
+
+    .. code-block::python
+
+        for change in tmp117.watch(0.5):
+            print("Temperature changed from", change.previous, "to", change.temperature)
+
+    """
+    if sensor._pin_wait is not None:
+        raise RuntimeError("Disable the data ready interrupt before watching")
+    raw_deadband = max(1, int(deadband / _TMP117_RESOLUTION))
+    sensor.alert_mode = AlertMode.WINDOW
+    if sensor._mode != _CONTINUOUS_CONVERSION_MODE:
+        sensor._set_mode_and_wait_for_measurement(_CONTINUOUS_CONVERSION_MODE)
+    center = sensor._raw_temperature
+    while True:
+        sensor._raw_high_limit = min(center + raw_deadband, 0x7FFF)
+        sensor._raw_low_limit = max(center - raw_deadband, -0x8000)
+        # clears any alert raised against the previous window
+        sensor._read_status()
+        while True:
+            if wait is None:
+                time.sleep(sensor._cycle_time)
+            else:
+                # a missed edge is caught by checking the flags after the timeout anyway
+                wait(_WATCH_TIMEOUT)
+            high_alert, low_alert, _ = sensor._read_status()
+            if high_alert or low_alert:
+                break
+        raw = sensor._raw_temperature
+        yield TemperatureChange(
+            raw * _TMP117_RESOLUTION, center * _TMP117_RESOLUTION, time.monotonic()
+        )
+        center = raw
@@ -0,0 +1,199 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_rollup`
+================================================================================
+
+Streaming summaries of TI TMP117 Temperature sensor readings over fixed windows of time, for
+sending statistics rather than every reading. Windows of several lengths are kept at once, each
+longer one built from the closed windows of the one before it, and only closed windows are
+reported. Readings are summarized as the sensor's raw 16-bit values, and only the reported
+statistics are converted to degrees Celsius.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+import time
+from collections import namedtuple
+
+from adafruit_tmp117 import _TMP117_RESOLUTION  # noqa: PLC2701
+
+try:
+    from typing import Optional, Sequence, Tuple
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+Rollup = namedtuple(
+    "Rollup", ["resolution", "start", "count", "mean", "stddev", "minimum", "maximum"]
+)
+"""The statistics of a closed window, reported by `TemperatureRollups`:
+
+* ``resolution``: the length of the window in seconds
+* ``start``: the time the window starts at, a multiple of ``resolution``
+* ``count``: the number of readings in the window
+* ``mean``: the mean temperature in degrees Celsius
+* ``stddev``: the population standard deviation of the temperature in degrees Celsius
+* ``minimum``: the lowest temperature in degrees Celsius
+* ``maximum``: the highest temperature in degrees Celsius
+"""
+
+
+class _Window:
+    """The running statistics of one window, kept with Welford's method"""
+
+    def __init__(self, resolution: float):
+        self.resolution = resolution
+        self.index = None
+        self.start = None
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = 0
+        self.maximum = 0
+
+    def index_of(self, timestamp: float) -> float:
+        # the number of the window holding timestamp. Floor division alone puts 0.5 in the
+        # fifth window of 0.1s, as 0.1 is stored slightly larger than a tenth
+        return (timestamp / self.resolution + 1e-9) // 1
+
+    def open(self, timestamp: float) -> None:
+        self.index = self.index_of(timestamp)
+        self.start = self.index * self.resolution
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, raw: int) -> None:
+        self.count += 1
+        delta = raw - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (raw - self.mean)
+        if self.count == 1:
+            self.minimum = self.maximum = raw
+        elif raw < self.minimum:
+            self.minimum = raw
+        elif raw > self.maximum:
+            self.maximum = raw
+
+    def merge(self, other: "_Window") -> None:
+        # the parallel form of Welford's method, combining two sets of statistics
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        if not self.count or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if not self.count or other.maximum > self.maximum:
+            self.maximum = other.maximum
+        self.count = count
+
+    def rollup(self) -> Rollup:
+        return Rollup(
+            self.resolution,
+            self.start,
+            self.count,
+            self.mean * _TMP117_RESOLUTION,
+            (self.m2 / self.count) ** 0.5 * _TMP117_RESOLUTION,
+            self.minimum * _TMP117_RESOLUTION,
+            self.maximum * _TMP117_RESOLUTION,
+        )
+
+
+class TemperatureRollups:
+    """Summarizes readings over windows of each of the given ``resolutions``. Each resolution
+    keeps the statistics of only its current window, so memory use does not grow with the
+    number of readings or the length of the windows.
+
+    Windows start at multiples of their resolution. A window closes when a reading arrives at
+    or after its end, and is then reported and folded into the window of the next resolution.
+
+    :param resolutions: The window lengths in seconds, shortest first. Each must be a whole
+        multiple of the one before it. Defaults to a second, a minute and an hour
+
+    .. code-block::python
+
+        import time
+        import board
+        from adafruit_tmp117 import TMP117
+        from adafruit_tmp117_rollup import TemperatureRollups
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        tmp117 = TMP117(i2c)
+        rollups = TemperatureRollups()
+
+        while True:
+            for rollup in rollups.record(tmp117):
+                if rollup.resolution == 60:
+                    print(rollup.start, rollup.mean, rollup.stddev)
+            time.sleep(0.125)
+
+    """
+
+    def __init__(self, resolutions: Sequence[float] = (1, 60, 3600)):
+        if not resolutions:
+            raise ValueError("at least one resolution is required")
+        previous = None
+        for resolution in resolutions:
+            if resolution <= 0:
+                raise ValueError("resolutions must be positive")
+            if previous is not None:
+                # with a tolerance, as float cascades such as 0.1 and 1 don't divide exactly
+                ratio = resolution / previous
+                if ratio <= 1 or abs(ratio - round(ratio)) > 1e-9:
+                    raise ValueError("each resolution must be a multiple of the one before it")
+            previous = resolution
+        self._windows = [_Window(resolution) for resolution in resolutions]
+
+    @property
+    def resolutions(self) -> Tuple[float, ...]:
+        """The window lengths in seconds"""
+        return tuple(window.resolution for window in self._windows)
+
+    def record(self, sensor: TMP117, timestamp: Optional[float] = None) -> list:
+        """Read the temperature from ``sensor`` and add it, returning the windows it closed.
+
+        :param sensor: The `TMP117 <adafruit_tmp117.TMP117>` to read
+        :param float timestamp: The time of the reading. Defaults to `time.monotonic`
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        return self.add(sensor.raw_temperature, timestamp)
+
+    def add(self, raw: int, timestamp: float) -> list:
+        """Add a raw reading taken at ``timestamp`` seconds, returning a list of the `Rollup`
+        for each window it closed, shortest first. Readings must be added in time order."""
+        closed = self._close(timestamp)
+        first = self._windows[0]
+        if not first.count:
+            first.open(timestamp)
+        first.add(raw)
+        return closed
+
+    def flush(self) -> list:
+        """Close every open window, returning their `Rollup`, shortest first"""
+        return self._close(None)
+
+    def _close(self, timestamp: Optional[float]) -> list:
+        closed = []
+        windows = self._windows
+        for level, window in enumerate(windows):
+            if not window.count:
+                continue
+            if timestamp is not None and window.index_of(timestamp) <= window.index:
+                # longer windows contain this one, so they can't have ended either
+                break
+            closed.append(window.rollup())
+            if level + 1 < len(windows):
+                parent = windows[level + 1]
+                if not parent.count:
+                    parent.open(window.start)
+                parent.merge(window)
+            window.count = 0
+        return closed
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""
+`adafruit_tmp117_scheduler`
+================================================================================
+
+Low power logging with TI TMP117 Temperature sensors: the sensors stay shut down and take one
+shot measurements timed to finish on a fixed schedule.
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+
+"""
+
+import time
+from collections import namedtuple
+
+from adafruit_tmp117 import MeasurementMode
+from adafruit_tmp117_group import TMP117Group
+
+try:
+    from typing import Sequence
+
+    from adafruit_tmp117 import TMP117
+except ImportError:
+    pass
+
+ScheduledMeasurement = namedtuple(
+    "ScheduledMeasurement", ["tick", "temperatures", "timestamps", "skipped"]
+)
+"""A measurement taken by :py:meth:`OneShotScheduler.measurements`:
+
+* ``tick``: the scheduled `time.monotonic` value the measurement was due at
+* ``temperatures``: the temperatures in degrees Celsius, in the same order as the sensors
+* ``timestamps``: the `time.monotonic` values when each measurement was read
+* ``skipped``: the number of ticks skipped before this one because the caller fell behind
+"""
+
+
+class OneShotScheduler:
+    """Takes a one shot measurement from each sensor every ``interval`` seconds. The sensors
+    are put into :py:const:`MeasurementMode.SHUTDOWN <adafruit_tmp117.MeasurementMode.SHUTDOWN>`
+    and are never left converting continuously, and each sensor's measurement is started early
+    by its own conversion time so that it is ready on the tick.
+
+    Ticks are fixed points in time counted from the first one, so the schedule does not drift
+    when the caller takes varying amounts of time between measurements. How early to start is
+    adjusted for each sensor after every measurement to account for the time its conversion and
+    the I2C reads actually took.
+
+    :param sensors: The `TMP117 <adafruit_tmp117.TMP117>` sensors to measure
+    :param float interval: The time between measurements in seconds
+
+    .. code-block::python
+
+        import board
+        from adafruit_tmp117 import TMP117
+        from adafruit_tmp117_scheduler import OneShotScheduler
+
+        i2c = board.I2C()  # uses board.SCL and board.SDA
+        scheduler = OneShotScheduler([TMP117(i2c)], 60)
+
+        for measurement in scheduler.measurements():
+            print(measurement.tick, measurement.temperatures[0])
+            print("Duty cycle:", scheduler.duty_cycle)
+
+    """
+
+    def __init__(self, sensors: Sequence[TMP117], interval: float):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self._group = TMP117Group(sensors)
+        self.interval = interval
+        self._active_time = 0.0
+        self._started = None
+        self._leads = None
+
+    @property
+    def sensors(self) -> list:
+        """The sensors being measured"""
+        return self._group.sensors
+
+    @property
+    def duty_cycle(self) -> float:
+        """An estimate of the fraction of the time since `measurements` was last called that the
+        sensors have spent converting, averaged across the sensors. It is counted from each
+        sensor's nominal `conversion_time <adafruit_tmp117.TMP117.conversion_time>`, which the
+        actual conversions can differ from slightly"""
+        if self._started is None:
+            return 0.0
+        elapsed = time.monotonic() - self._started
+        if elapsed <= 0:
+            return 0.0
+        return self._active_time / (elapsed * len(self.sensors))
+
+    def measurements(self):
+        """Yield a `ScheduledMeasurement` on every tick, starting one ``interval`` from now"""
+        for sensor in self.sensors:
+            sensor.configure(mode=MeasurementMode.SHUTDOWN)
+        if self._leads is None:
+            self._leads = [sensor.conversion_time for sensor in self.sensors]
+        leads = self._leads
+        # duty_cycle covers the latest call only, so both of its counts start again together
+        self._active_time = 0.0
+        self._started = time.monotonic()
+        tick = self._started
+        while True:
+            tick += self.interval
+            skipped = 0
+            # if the previous measurement was held on to past the start of this one, skip ahead
+            while time.monotonic() > tick - max(leads):
+                tick += self.interval
+                skipped += 1
+
+            measurement = self._group._measure([tick - lead for lead in leads])
+            self._active_time += sum(sensor.conversion_time for sensor in self.sensors)
+            # move each start halfway towards where it would have landed the reading on the tick
+            for index, timestamp in enumerate(measurement.timestamps):
+                leads[index] = max(0, leads[index] + (timestamp - tick) / 2)
+            yield ScheduledMeasurement(
+                tick, measurement.temperatures, measurement.timestamps, skipped
+            )
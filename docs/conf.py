@@ -25,7 +25,7 @@ extensions = [
 # Uncomment the below if you use native CircuitPython modules such as
 # digitalio, micropython and busio. List the modules you use. Without it, the
 # autodoc module docs will fail to generate with a warning.
-autodoc_mock_imports = ["digitalio", "busio"]
+autodoc_mock_imports = ["digitalio", "busio", "numpy"]
 
 
 intersphinx_mapping = {
@@ -34,10 +34,6 @@ intersphinx_mapping = {
         "https://docs.circuitpython.org/projects/busdevice/en/latest/",
         None,
     ),
-    "Register": (
-        "https://docs.circuitpython.org/projects/register/en/latest/",
-        None,
-    ),
     "CircuitPython": ("https://docs.circuitpython.org/en/latest/", None),
 }
 
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+import asyncio
+
+import board
+
+from adafruit_tmp117 import AverageCount
+from adafruit_tmp117_asyncio import TMP117Async
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+tmp117 = TMP117Async(i2c)
+
+
+async def continuous():
+    async for temperature in tmp117.readings():
+        print(f"Continuous: {temperature:.2f} degrees C")
+
+
+async def heartbeat():
+    while True:
+        print("The event loop is free while the sensor measures")
+        await asyncio.sleep(0.25)
+
+
+async def main():
+    tmp117.averaged_measurements = AverageCount.AVERAGE_64X
+    print(f"Single measurement: {await tmp117.take_single_measurement():.2f} degrees C")
+    await asyncio.gather(continuous(), heartbeat())
+
+
+asyncio.run(main())
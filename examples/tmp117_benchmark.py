@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+
+# Measures the I2C traffic and time each driver operation costs, using the emulator on a
+# virtual clock. Runs on Linux or any other desktop Python, no hardware needed.
+#
+#   python tmp117_benchmark.py                      print the results as JSON
+#   python tmp117_benchmark.py --check baseline     exit with an error if anything regressed
+#   python tmp117_benchmark.py --save baseline      record a new baseline
+import argparse
+import json
+import sys
+import time
+
+import adafruit_tmp117
+from adafruit_tmp117 import TMP117, AlertMode, AverageCount, MeasurementDelay, MeasurementMode
+from adafruit_tmp117_emulator import EmulatedI2C, TMP117Emulator, VirtualClock
+
+CALLS = 20
+# how far a metric may grow past its baseline before it counts as a regression
+TOLERANCE = {
+    "transactions": 0.0,
+    "bytes": 0.0,
+    "locks": 0.0,
+    "virtual_seconds": 0.05,
+}
+
+clock = VirtualClock()
+emulator = TMP117Emulator(clock=clock)
+i2c = EmulatedI2C(emulator)
+
+
+def sensor():
+    emulator.write_register(0x01, 0x0002)  # power on state for every operation
+    return TMP117(i2c)
+
+
+def operations(tmp117):
+    def set_averaging():
+        tmp117.averaged_measurements = AverageCount.AVERAGE_8X
+
+    def set_delay():
+        tmp117.measurement_delay = MeasurementDelay.DELAY_1_S
+
+    def set_alert_mode():
+        tmp117.alert_mode = AlertMode.WINDOW
+
+    def set_mode():
+        tmp117.measurement_mode = MeasurementMode.CONTINUOUS
+
+    def set_high_limit():
+        tmp117.high_limit = 30
+
+    def set_low_limit():
+        tmp117.low_limit = 10
+
+    def set_offset():
+        tmp117.temperature_offset = 0.5
+
+    def single_measurement_1x():
+        tmp117.averaged_measurements = AverageCount.AVERAGE_1X
+        tmp117.take_single_measurement()
+
+    def single_measurement_64x():
+        tmp117.averaged_measurements = AverageCount.AVERAGE_64X
+        tmp117.take_single_measurement()
+
+    return {
+        "constructor": lambda: TMP117(i2c),
+        "constructor_no_reset": lambda: TMP117(i2c, reset=False),
+        "initialize": tmp117.initialize,
+        "temperature": lambda: tmp117.temperature,
+        "raw_temperature": lambda: tmp117.raw_temperature,
+        "alert_status": lambda: tmp117.alert_status,
+        "averaged_measurements": lambda: tmp117.averaged_measurements,
+        "set_averaged_measurements": set_averaging,
+        "set_measurement_delay": set_delay,
+        "set_alert_mode": set_alert_mode,
+        "set_measurement_mode": set_mode,
+        "set_high_limit": set_high_limit,
+        "set_low_limit": set_low_limit,
+        "set_temperature_offset": set_offset,
+        "serial_number": lambda: tmp117.serial_number,
+        "refresh_identity": tmp117.refresh_identity,
+        "take_single_measurement_1x": single_measurement_1x,
+        "take_single_measurement_64x": single_measurement_64x,
+    }
+
+
+def measure(operation):
+    operation()  # warm up caches so only the steady state is measured
+    i2c.reset_counters()
+    virtual_start = clock.now
+    wall_start = time.perf_counter()
+    for _ in range(CALLS):
+        operation()
+    wall_seconds = time.perf_counter() - wall_start
+    return {
+        "transactions": i2c.transactions / CALLS,
+        "bytes": i2c.bytes_transferred / CALLS,
+        "locks": i2c.locks / CALLS,
+        "virtual_seconds": round((clock.now - virtual_start) / CALLS, 6),
+        "wall_seconds": wall_seconds / CALLS,
+    }
+
+
+def run():
+    with clock.patch(adafruit_tmp117):
+        return {name: measure(operation) for name, operation in operations(sensor()).items()}
+
+
+def regressions(results, baseline):
+    for name, expected in baseline.items():
+        if name not in results:
+            yield f"{name}: missing"
+            continue
+        for metric, tolerance in TOLERANCE.items():
+            limit = expected[metric] * (1 + tolerance) + 1e-9
+            if results[name][metric] > limit:
+                yield f"{name}: {metric} {results[name][metric]} > baseline {expected[metric]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TMP117 driver benchmarks")
+    parser.add_argument("--check", metavar="BASELINE", help="compare against a baseline file")
+    parser.add_argument("--save", metavar="BASELINE", help="write the results as a baseline")
+    args = parser.parse_args()
+
+    results = run()
+    if args.save:
+        baseline = {
+            name: {metric: result[metric] for metric in TOLERANCE}
+            for name, result in results.items()
+        }
+        with open(args.save, "w") as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+    if args.check:
+        with open(args.check) as baseline_file:
+            failures = list(regressions(results, json.load(baseline_file)))
+        for failure in failures:
+            print("REGRESSION", failure, file=sys.stderr)
+        sys.exit(1 if failures else 0)
+
+
+main()
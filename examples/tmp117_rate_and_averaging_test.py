@@ -5,8 +5,6 @@
 
 # This example is best viewed using a serial plotter
 # such as the one built into the Mu editor.
-import time
-
 import board
 
 from adafruit_tmp117 import TMP117, AverageCount, MeasurementDelay
@@ -41,6 +39,6 @@ print(
 )
 print("")
 
-while True:
-    print("Temperature:", tmp117.temperature)
-    time.sleep(0.01)
+# only new measurements are printed, as soon as each one is ready
+for sample in tmp117.samples():
+    print("Temperature:", sample.temperature)
@@ -23,7 +23,7 @@ print(
 )
 print(
     "Reads should take approximately",
-    AverageCount.string[tmp117.averaged_measurements] * 0.0155,
+    tmp117.conversion_time,
     "seconds",
 )
 
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: Unlicense
+import gc
+
+import board
+
+from adafruit_tmp117 import TMP117
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+tmp117 = TMP117(i2c)
+
+READS = 100
+status = bytearray(3)
+
+
+def bytes_allocated_per_read(read):
+    read()  # warm up so one-time allocations aren't counted
+    gc.collect()
+    before = gc.mem_alloc()
+    for _ in range(READS):
+        read()
+    return (gc.mem_alloc() - before) / READS
+
+
+print("Bytes allocated per read:")
+print("temperature:", bytes_allocated_per_read(lambda: tmp117.temperature))
+print("alert_status:", bytes_allocated_per_read(lambda: tmp117.alert_status))
+print("raw_temperature:", bytes_allocated_per_read(lambda: tmp117.raw_temperature))
+print(
+    "temperature_millicelsius:",
+    bytes_allocated_per_read(lambda: tmp117.temperature_millicelsius),
+)
+print("read_status_into:", bytes_allocated_per_read(lambda: tmp117.read_status_into(status)))
+
+while True:
+    tmp117.read_status_into(status)
+    if status[2]:
+        print("Temperature:", tmp117.temperature_millicelsius, "millidegrees C")